@@ -0,0 +1,249 @@
+"""
+Banc d'essai reproductible du solveur TSP (tsp_graph_init.py)
+Chaque instance est générée avec une graine fixe et résolue dans son propre processus ;
+on mesure le temps et le pic de mémoire résidente de chaque phase (remis à zéro
+avant chacune, sous Linux), et la qualité de la route finale.
+Les résultats sont écrits en JSON pour être comparés d'une version à l'autre.
+
+Exemples :
+    python benchmark_tsp.py --tailles 20 100 1000 --sortie bench.json
+    python benchmark_tsp.py --sortie bench_v2.json --comparer bench.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import platform
+import random
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import tsp_graph_init as tsp
+
+TAILLES_STANDARD = [20, 100, 1000, 10000, 50000]
+GRAINE_DEFAUT = 12345
+PLANCHER_TEMPS = 0.05  # Écart absolu (s) en dessous duquel une différence de temps est du bruit
+
+
+def rss_max_ko():
+    """Pic de mémoire résidente depuis le début du processus (Ko), ou None si indisponible."""
+    if resource is None:
+        return None
+    pic = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pic // 1024 if sys.platform == "darwin" else pic
+
+
+def reinitialiser_pic_memoire():
+    """
+    Remet le pic de mémoire résidente (VmHWM) au niveau actuel, sous Linux
+    (écriture de 5 dans /proc/self/clear_refs), sans surcoût pendant la mesure.
+
+    Returns:
+        bool: Vrai si le pic a été remis à zéro (sinon seul rss_max_ko est disponible)
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def pic_memoire_ko():
+    """Pic de mémoire résidente (Ko) depuis le dernier reinitialiser_pic_memoire(), ou None."""
+    try:
+        with open("/proc/self/status") as f:
+            for ligne in f:
+                if ligne.startswith("VmHWM:"):
+                    return int(ligne.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def memoire_phase(pic_reinitialise):
+    """Mesure mémoire d'une phase : son propre pic si possible, sinon le pic cumulé du processus."""
+    if pic_reinitialise:
+        return {"memoire_pic_ko": pic_memoire_ko()}
+    return {"rss_max_cumule_ko": rss_max_ko()}
+
+
+def mesurer(phases, nom, fonction, *args, **kwargs):
+    """Exécute une phase, enregistre son temps et son pic mémoire ; renvoie son résultat."""
+    pic_reinitialise = reinitialiser_pic_memoire()
+    temps_debut = time.perf_counter()
+    try:
+        resultat = fonction(*args, **kwargs)
+        erreur = None
+    except Exception as e:
+        resultat = None
+        erreur = f"{type(e).__name__}: {e}"
+    phases[nom] = {"temps": time.perf_counter() - temps_debut, **memoire_phase(pic_reinitialise)}
+    if erreur:
+        phases[nom]["erreur"] = erreur
+    return resultat
+
+
+def executer_instance(nb_lieux, graine, nb_generations, temps_max_2opt):
+    """Génère une instance et mesure chaque phase (exécuté dans un processus dédié)."""
+    random.seed(graine)
+    np.random.seed(graine)
+    phases = {}
+    resultat = {"nb_lieux": nb_lieux, "graine": graine, "phases": phases}
+
+    graph = mesurer(phases, "generation", tsp.Graph, path=None,
+                    nb_lieux_defaut=nb_lieux, calculer_matrice=False)
+    if len(graph.liste_lieux) < 30000:
+        mesurer(phases, "matrice", graph.calcul_matrice_cout_od)
+    mesurer(phases, "voisins_candidats", graph.calcul_voisins_candidats)
+
+    ordre = mesurer(phases, "heuristique", graph.tour_plus_proche_voisin, 0)
+    if ordre is not None:
+        route = tsp.Route(graph, np.asarray(ordre, dtype=np.int32))
+        resultat["distance_heuristique"] = longueur_tour(graph, route.ordre)
+        recherche = tsp.RechercheLocale(graph)
+        mesurer(phases, "2opt", recherche.optimiser, route, temps_max=temps_max_2opt)
+        resultat["distance_2opt"] = longueur_tour(graph, route.ordre)
+        resultat["mouvements_2opt"] = recherche.nb_mouvements
+
+    tsp_ga = tsp.TSP_GA(graph, mode_tableau=True)
+    tsp_ga.temps_max_2opt = temps_max_2opt
+    mesurer(phases, "initialisation_ga", tsp_ga.initialiser_avec_heuristique)
+
+    temps_generations = []
+    pic_reinitialise = reinitialiser_pic_memoire()
+    if tsp_ga.population:
+        for iteration in range(1, nb_generations + 1):
+            tsp_ga.iteration_courante = iteration
+            temps_debut = time.perf_counter()
+            try:
+                tsp_ga.nouvelle_generation()
+            except Exception as e:
+                phases["generations"] = {"erreur": f"{type(e).__name__}: {e}"}
+                break
+            temps_generations.append(time.perf_counter() - temps_debut)
+    if temps_generations:
+        phases["generations"] = {
+            "temps": sum(temps_generations),
+            "temps_par_generation": float(np.median(temps_generations)),
+            "nb_generations": len(temps_generations),
+            **memoire_phase(pic_reinitialise),
+        }
+    if tsp_ga.meilleure_route is not None:
+        resultat["distance_finale"] = longueur_tour(graph, tsp_ga.meilleure_route.ordre)
+    resultat["rss_max_ko"] = rss_max_ko()
+    return resultat
+
+
+def longueur_tour(graph, ordre):
+    """Longueur exacte (float64, depuis les coordonnées) d'un ordre fermé."""
+    points = graph.coordonnees[np.asarray(ordre, dtype=np.intp)]
+    return float(np.hypot(*np.diff(points, axis=0).T).sum())
+
+
+def version_code():
+    """Identifiant git de la version mesurée (ou None hors dépôt)."""
+    try:
+        return subprocess.run(["git", "describe", "--always", "--dirty"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def comparer(reference, actuel, seuil, plancher=PLANCHER_TEMPS):
+    """
+    Compare deux résultats de banc d'essai. Un temps n'est en régression que s'il
+    dépasse la référence à la fois du seuil relatif et du plancher absolu : les
+    phases de quelques millisecondes varient du simple au double d'une exécution à l'autre.
+
+    Args:
+        reference (dict): Rapport de référence
+        actuel (dict): Rapport mesuré
+        seuil (float): Dégradation relative tolérée
+        plancher (float): Dégradation absolue tolérée en secondes
+
+    Returns:
+        list: Messages de régression (temps ou qualité dégradés au-delà du seuil relatif)
+    """
+    regressions = []
+    anciens = {(r["nb_lieux"], r["graine"]): r for r in reference["resultats"]}
+    for nouveau in actuel["resultats"]:
+        ancien = anciens.get((nouveau["nb_lieux"], nouveau["graine"]))
+        if ancien is None:
+            continue
+        etiquette = f"n={nouveau['nb_lieux']}"
+        for phase, mesure in nouveau["phases"].items():
+            avant = ancien["phases"].get(phase, {})
+            if "erreur" in mesure and "erreur" not in avant:
+                regressions.append(f"{etiquette} {phase}: erreur {mesure['erreur']}")
+            cle = "temps_par_generation" if phase == "generations" else "temps"
+            if (cle in mesure and cle in avant and mesure[cle] > avant[cle] * (1 + seuil)
+                    and mesure[cle] - avant[cle] > plancher):
+                regressions.append(f"{etiquette} {phase}: {avant[cle]:.4f}s -> {mesure[cle]:.4f}s")
+        for cle in ("distance_heuristique", "distance_2opt", "distance_finale"):
+            if cle in nouveau and cle in ancien and nouveau[cle] > ancien[cle] * (1 + seuil / 10):
+                regressions.append(f"{etiquette} {cle}: {ancien[cle]:.2f} -> {nouveau[cle]:.2f}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Banc d'essai reproductible du solveur TSP")
+    parser.add_argument("--tailles", type=int, nargs="+", default=TAILLES_STANDARD)
+    parser.add_argument("--graine", type=int, default=GRAINE_DEFAUT)
+    parser.add_argument("--generations", type=int, default=10, help="Générations GA mesurées")
+    parser.add_argument("--temps-max-2opt", type=float, default=60.0)
+    parser.add_argument("--sortie", default=None, help="Fichier JSON de résultats")
+    parser.add_argument("--comparer", default=None, help="Fichier JSON de référence")
+    parser.add_argument("--seuil", type=float, default=0.2, help="Dégradation relative tolérée")
+    parser.add_argument("--plancher", type=float, default=PLANCHER_TEMPS,
+                        help="Dégradation absolue tolérée sur les temps (s)")
+    args = parser.parse_args(argv)
+
+    rapport = {
+        "version": version_code(),
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "parametres": {"graine": args.graine, "generations": args.generations,
+                       "temps_max_2opt": args.temps_max_2opt},
+        "resultats": [],
+    }
+
+    contexte = multiprocessing.get_context("spawn")
+    for nb_lieux in args.tailles:
+        # Un processus neuf par instance : pic mémoire propre à l'instance
+        with ProcessPoolExecutor(max_workers=1, mp_context=contexte) as executeur:
+            resultat = executeur.submit(executer_instance, nb_lieux, args.graine,
+                                        args.generations, args.temps_max_2opt).result()
+        rapport["resultats"].append(resultat)
+        resume = ", ".join(f"{nom}={mesure['temps']:.3f}s" for nom, mesure in resultat["phases"].items()
+                           if "temps" in mesure)
+        print(f"[n={nb_lieux}] {resume} | finale={resultat.get('distance_finale')}")
+
+    texte = json.dumps(rapport, indent=2, sort_keys=True)
+    if args.sortie:
+        with open(args.sortie, 'w', encoding='utf-8') as fichier:
+            fichier.write(texte + "\n")
+
+    if args.comparer:
+        with open(args.comparer, 'r', encoding='utf-8') as fichier:
+            reference = json.load(fichier)
+        regressions = comparer(reference, rapport, args.seuil, args.plancher)
+        for message in regressions:
+            print(f"RÉGRESSION {message}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,10 +6,28 @@ Groupe 5 Léa Léa Lou-Anne Lisa
 import numpy as np
 import random
 import csv
-import tkinter as tk
-from tkinter import Canvas, Text, Scrollbar
 import time
+import argparse
+import sys
 import threading
+import os
+import hashlib
+import math
+import traceback
+import io
+import contextlib
+from collections import deque
+from collections.abc import Sequence
+import multiprocessing
+import queue
+from multiprocessing import shared_memory
+
+# Tkinter est optionnel : le solveur fonctionne sans affichage (serveurs, conteneurs)
+try:
+    import tkinter as tk
+    from tkinter import Canvas, Text, Scrollbar
+except ImportError:
+    tk = None
 
 # ============================================================================
 # CONSTANTES GLOBALES
@@ -18,6 +36,16 @@ import threading
 LARGEUR = 800  # Largeur de la zone d'affichage
 HAUTEUR = 600  # Hauteur de la zone d'affichage
 NB_LIEUX = 30  # Nombre de lieux à générer/charger depuis un fichier csv
+SEUIL_MATRICE = 30000  # Au-delà, mode sans matrice : distances calculées depuis les coordonnées
+TAILLE_BLOC_MATRICE = 512  # Nombre de lignes de la matrice calculées par bloc vectorisé
+COUT_CASE_MATRICE = 1.2e-8  # Secondes par case de la matrice (estimation, budget de temps)
+NB_VOISINS_CANDIDATS = 10  # Nombre de plus proches voisins candidats par lieu (recherche locale)
+LIMITE_2OPT_ENFANT = 1000  # Nombre de lieux maximal pour le 2-opt sur les enfants
+LIMITE_2OPT_ENFANT_PARALLELE = 10000  # Idem dans les processus du pool, où chaque enfant est optimisé
+LIMITE_2OPT_HEURISTIQUE = 50000  # Nombre de lieux maximal pour le 2-opt sur la route heuristique
+SEUIL_HELD_KARP = 20  # Jusqu'à ce nombre de lieux, résolution exacte (Held-Karp) au lieu du GA
+LIEUX_PAR_CLUSTER = 1000  # Taille visée des clusters de la décomposition spatiale
+VERSION_POINT_REPRISE = 1  # Version du format binaire des points de reprise
 
 # ============================================================================
 # CLASSE LIEU
@@ -66,6 +94,106 @@ class Lieu:
     def __repr__(self):
         return f"Lieu {self.nom}: ({self.x:.2f}, {self.y:.2f})"
 
+
+class ListeLieux(Sequence):
+    """
+    Séquence de lieux adossée au tableau (n, 2) des coordonnées.
+    Les objets Lieu ne sont créés qu'à la lecture (affichage), pas au chargement.
+    """
+
+    def __init__(self, coordonnees):
+        self.coordonnees = coordonnees
+
+    def __len__(self):
+        return len(self.coordonnees)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self[i] for i in range(*indice.indices(len(self)))]
+        if indice < 0:
+            indice += len(self)
+        x, y = self.coordonnees[indice]
+        return Lieu(float(x), float(y), str(indice))
+
+    def __iter__(self):
+        for i, (x, y) in enumerate(self.coordonnees.tolist()):
+            yield Lieu(x, y, str(i))
+
+
+# ============================================================================
+# LECTURE DES FICHIERS DE LIEUX
+#Chargement en bloc des coordonnées dans un tableau (n, 2) float64 :
+#CSV (avec ou sans en-tête), .npy, binaire float32 brut (.f32 / .bin) et TSPLIB (.tsp).
+# ============================================================================
+
+def _est_ligne_numerique(ligne):
+    """Vrai si les deux premiers champs de la ligne CSV sont des nombres."""
+    champs = ligne.strip().split(',')
+    if len(champs) < 2:
+        return False
+    try:
+        float(champs[0])
+        float(champs[1])
+        return True
+    except ValueError:
+        return False
+
+
+def lire_csv_coordonnees(chemin):
+    """
+    Lit les deux premières colonnes d'un CSV en tableau (n, 2) float64.
+    L'en-tête éventuel est détecté sur la première ligne ; en cas de lignes
+    irrégulières, on revient à une lecture ligne à ligne qui les ignore.
+    """
+    with open(chemin, 'r', encoding='utf-8') as fichier:
+        entete = 0 if _est_ligne_numerique(fichier.readline()) else 1
+    try:
+        return np.loadtxt(chemin, delimiter=',', usecols=(0, 1), skiprows=entete,
+                          dtype=np.float64, ndmin=2, encoding='utf-8')
+    except ValueError:
+        points = []
+        with open(chemin, 'r', encoding='utf-8') as fichier:
+            for ligne in csv.reader(fichier):
+                if len(ligne) < 2:
+                    continue
+                try:
+                    points.append((float(ligne[0]), float(ligne[1])))
+                except ValueError:
+                    pass
+        return np.array(points, dtype=np.float64).reshape(-1, 2)
+
+
+def lire_tsplib(chemin):
+    """
+    Lit la section NODE_COORD_SECTION d'un fichier TSPLIB (.tsp) en tableau (n, 2).
+    Les distances restent euclidiennes (sans l'arrondi entier de EUC_2D).
+    """
+    entete = {}
+    lignes = []
+    with open(chemin, 'r', encoding='utf-8') as fichier:
+        dans_section = False
+        for ligne in fichier:
+            ligne = ligne.strip()
+            if not ligne:
+                continue
+            if dans_section:
+                if ligne == "EOF" or not ligne[0].isdigit():
+                    break
+                lignes.append(ligne)
+            elif ligne.startswith("NODE_COORD_SECTION"):
+                dans_section = True
+            elif ":" in ligne:
+                cle, valeur = ligne.split(":", 1)
+                entete[cle.strip().upper()] = valeur.strip()
+
+    type_distance = entete.get("EDGE_WEIGHT_TYPE", "EUC_2D")
+    if type_distance not in ("EUC_2D", "CEIL_2D", "ATT"):
+        print(f"Type de distance TSPLIB {type_distance} non géré : distance euclidienne utilisée")
+    if not lignes:
+        return np.empty((0, 2), dtype=np.float64)
+    tableau = np.loadtxt(lignes, dtype=np.float64, ndmin=2)
+    return tableau[:, 1:3]
+
 # ============================================================================
 # CLASSE GRAPH
 #Cette classe est utilisée pour mémoriser une liste de lieux (variable liste_lieux).
@@ -78,6 +206,147 @@ class Lieu:
 
 # ============================================================================
 
+# ============================================================================
+# CLASSE GRILLE SPATIALE
+#Index spatial par grille régulière : chaque cellule contient les lieux qui s'y trouvent.
+#Permet de trouver le plus proche lieu non visité sans parcourir tous les lieux,
+#avec suppression en O(1) des lieux visités.
+# ============================================================================
+
+class GrilleSpatiale:
+    """
+    Grille régulière sur les coordonnées des lieux, pour les requêtes
+    "plus proche lieu restant" avec suppression.
+    """
+
+    def __init__(self, coordonnees, lieux_par_cellule=2):
+        """
+        Construit la grille.
+        
+        Args:
+            coordonnees (np.ndarray): Tableau (n, 2) des coordonnées
+            lieux_par_cellule (int): Nombre moyen de lieux visé par cellule
+        """
+        n = len(coordonnees)
+        self.coordonnees = coordonnees
+        self.xs = coordonnees[:, 0].tolist()
+        self.ys = coordonnees[:, 1].tolist()
+        self.x_min = float(coordonnees[:, 0].min()) if n else 0.0
+        self.y_min = float(coordonnees[:, 1].min()) if n else 0.0
+        largeur = (float(coordonnees[:, 0].max()) - self.x_min) if n else 0.0
+        hauteur = (float(coordonnees[:, 1].max()) - self.y_min) if n else 0.0
+        
+        # Taille de cellule telle que chaque cellule contienne ~lieux_par_cellule lieux
+        surface = max(largeur * hauteur, 1e-12)
+        self.taille = max(np.sqrt(surface * lieux_par_cellule / max(n, 1)), 1e-9)
+        self.nx = int(largeur / self.taille) + 1
+        self.ny = int(hauteur / self.taille) + 1
+        
+        cx = ((coordonnees[:, 0] - self.x_min) / self.taille).astype(np.int64)
+        cy = ((coordonnees[:, 1] - self.y_min) / self.taille).astype(np.int64)
+        np.clip(cx, 0, self.nx - 1, out=cx)
+        np.clip(cy, 0, self.ny - 1, out=cy)
+        self.cellule_de = (cy * self.nx + cx).tolist()
+        
+        self.cellules = [[] for _ in range(self.nx * self.ny)]
+        self.position = [0] * n  # Position de chaque lieu dans sa cellule
+        for i, c in enumerate(self.cellule_de):
+            self.position[i] = len(self.cellules[c])
+            self.cellules[c].append(i)
+        self.nb_restants = n
+
+    def supprimer(self, i):
+        """Retire le lieu i de la grille (échange avec le dernier de sa cellule)."""
+        cellule = self.cellules[self.cellule_de[i]]
+        pos = self.position[i]
+        dernier = cellule.pop()
+        if dernier != i:
+            cellule[pos] = dernier
+            self.position[dernier] = pos
+        self.nb_restants -= 1
+
+    def plus_proche(self, i):
+        """
+        Renvoie le lieu restant le plus proche du lieu i (ou None si la grille est vide).
+        Parcourt les anneaux de cellules autour de i jusqu'à ce que l'anneau
+        suivant soit forcément plus loin que le meilleur candidat trouvé.
+        """
+        if self.nb_restants == 0:
+            return None
+        x, y = self.xs[i], self.ys[i]
+        c = self.cellule_de[i]
+        cx, cy = c % self.nx, c // self.nx
+        meilleur = None
+        dist2_min = float('inf')
+        rayon_max = max(self.nx, self.ny)
+        
+        for r in range(rayon_max + 1):
+            for gy in range(max(0, cy - r), min(self.ny, cy + r + 1)):
+                bord = gy == cy - r or gy == cy + r
+                pas = 1 if bord else 2 * r
+                for gx in range(cx - r, cx + r + 1, max(1, pas)):
+                    if gx < 0 or gx >= self.nx:
+                        continue
+                    for j in self.cellules[gy * self.nx + gx]:
+                        dx = self.xs[j] - x
+                        dy = self.ys[j] - y
+                        d2 = dx * dx + dy * dy
+                        if d2 < dist2_min:
+                            dist2_min = d2
+                            meilleur = j
+            # Tout lieu hors des anneaux 0..r est à une distance >= r * taille
+            limite = r * self.taille
+            if meilleur is not None and dist2_min <= limite * limite:
+                break
+        return meilleur
+
+    def k_plus_proches(self, k):
+        """
+        Calcule les k plus proches voisins de chaque lieu (grille non modifiée).
+        Traitement vectorisé cellule par cellule : on élargit le carré de cellules
+        candidates jusqu'à ce que le k-ième voisin soit garanti à l'intérieur.
+        
+        Args:
+            k (int): Nombre de voisins par lieu
+            
+        Returns:
+            np.ndarray: Tableau (n, k) int32, voisins triés par distance croissante
+        """
+        n = len(self.xs)
+        k = min(k, n - 1)
+        voisins = np.empty((n, max(k, 0)), dtype=np.int32)
+        if k <= 0:
+            return voisins
+        rayon_max = max(self.nx, self.ny)
+        
+        for c, membres in enumerate(self.cellules):
+            if not membres:
+                continue
+            cx, cy = c % self.nx, c // self.nx
+            points = self.coordonnees[membres]
+            r = 1
+            while True:
+                candidats = []
+                for gy in range(max(0, cy - r), min(self.ny, cy + r + 1)):
+                    ligne = gy * self.nx
+                    for gx in range(max(0, cx - r), min(self.nx, cx + r + 1)):
+                        candidats.extend(self.cellules[ligne + gx])
+                if len(candidats) > k:
+                    candidats = np.asarray(candidats)
+                    diff = points[:, None, :] - self.coordonnees[candidats][None, :, :]
+                    d2 = np.einsum('ijk,ijk->ij', diff, diff)
+                    d2[candidats[None, :] == np.asarray(membres)[:, None]] = np.inf
+                    idx = np.argpartition(d2, k - 1, axis=1)[:, :k]
+                    d2_k = np.take_along_axis(d2, idx, axis=1)
+                    limite = r * self.taille
+                    if d2_k.max() <= limite * limite or r >= rayon_max:
+                        tri = np.argsort(d2_k, axis=1, kind='stable')
+                        voisins[membres] = candidats[np.take_along_axis(idx, tri, axis=1)]
+                        break
+                r += 1
+        return voisins
+
+
 # ============================================================================
 # CLASSE GRAPH
 # ============================================================================
@@ -88,11 +357,18 @@ class Graph:
     Gère la liste des lieux, la matrice des distances et les opérations associées.
     """
     
-    def __init__(self, path=None, nb_lieux_defaut=NB_LIEUX):
+    def __init__(self, path=None, nb_lieux_defaut=NB_LIEUX, calculer_matrice=True, dossier_cache=None):
         self.liste_lieux = []
+        self.coordonnees = None  # Tableau (n, 2) float64 contigu des coordonnées
+        self._xs = []  # Copies en listes Python pour les accès scalaires rapides
+        self._ys = []
+        self._x = None  # Colonnes contiguës float64 pour les calculs vectorisés (mode direct)
+        self._y = None
         self.matrice_od = None
+        self.voisins_candidats = None  # Tableau (n, k) int32 des k plus proches voisins
         self.mode_direct = False  # Pour calcul direct sans matrice
-        
+        self.dossier_cache = dossier_cache  # Dossier des matrices/voisins persistés (optionnel)
+
         if path is None:
             print("Mode: Génération aléatoire de lieux.")
             self.generer_lieux_aleatoires(nb_lieux_defaut)
@@ -101,14 +377,38 @@ class Graph:
             self.charger_graph(path)
             
         if self.liste_lieux:
-            # OPTIMISATION: Ne créer matrice que si < 30 000 lieux
-            if len(self.liste_lieux) < 30000:
-                self.calcul_matrice_cout_od()
+            self.construire_coordonnees()
+            # OPTIMISATION: Ne créer matrice que si < SEUIL_MATRICE lieux
+            if calculer_matrice and len(self.liste_lieux) < SEUIL_MATRICE:
+                if self.dossier_cache:
+                    self.charger_ou_calculer_matrice(self.dossier_cache)
+                else:
+                    self.calcul_matrice_cout_od()
             else:
                 self.mode_direct = True
         else:
             print("Erreur: Aucun lieu n'a été chargé ou généré.")
     
+    @classmethod
+    def depuis_tableaux(cls, coordonnees, matrice_od=None, voisins_candidats=None):
+        """
+        Construit un graphe directement à partir de tableaux déjà calculés
+        (par exemple attachés en mémoire partagée), sans recalcul de la matrice.
+        
+        Args:
+            coordonnees (np.ndarray): Tableau (n, 2) des coordonnées
+            matrice_od (np.ndarray): Matrice des distances (optionnelle)
+            voisins_candidats (np.ndarray): Voisins candidats (optionnels)
+        """
+        graph = cls.__new__(cls)
+        graph.definir_coordonnees(coordonnees)
+        graph.liste_lieux = ListeLieux(coordonnees)
+        graph.matrice_od = matrice_od
+        graph.voisins_candidats = voisins_candidats
+        graph.mode_direct = matrice_od is None
+        graph.dossier_cache = None
+        return graph
+
     def generer_lieux_aleatoires(self, nb_lieux=NB_LIEUX):
         """Génère aléatoirement des lieux dans l'espace défini."""
         self.liste_lieux = []
@@ -122,91 +422,263 @@ class Graph:
         print(f"{nb_lieux} lieux générés aléatoirement.")
     
     def charger_graph(self, nom_fichier):
-        """Charge la liste des lieux depuis un fichier CSV (VERSION CORRIGÉE)."""
+        """
+        Charge la liste des lieux depuis un fichier, en bloc dans un tableau NumPy :
+        CSV (en-tête détecté), .npy, binaire float32 brut (.f32 / .bin) ou TSPLIB (.tsp).
+        Les objets Lieu ne sont créés qu'à la demande (ListeLieux).
+        """
         self.liste_lieux = []
-        global NB_LIEUX
 
-        # Extraction NB_LIEUX depuis le nom
+        # Nombre de lieux attendu d'après le nom (graph_20.csv), pour contrôle uniquement
+        nb_attendu = None
         try:
-            nom_base = nom_fichier.split('/')[-1]
-            partie_num = nom_base.split('_')[1]
-            nb_str = partie_num.split('.')[0]
-            NB_LIEUX = int(nb_str)
-            print(f"NB_LIEUX extrait: {NB_LIEUX}")
+            nom_base = os.path.basename(nom_fichier)
+            nb_attendu = int(nom_base.split('_')[1].split('.')[0])
         except (IndexError, ValueError, TypeError):
-            print(f"Impossible d'extraire NB_LIEUX depuis '{nom_fichier}'")
+            pass
 
         try:
-            with open(nom_fichier, 'r', encoding='utf-8') as fichier:
-                lecteur = csv.reader(fichier)
-                
-                # UNE SEULE BOUCLE pour lire toutes les lignes
-                for num_ligne, ligne in enumerate(lecteur):
-                    if len(ligne) < 2:
-                        continue
-                    
-                    try:
-                        x = float(ligne[0])
-                        y = float(ligne[1])
-                        nom = str(len(self.liste_lieux))
-                        lieu = Lieu(x, y, nom)
-                        self.liste_lieux.append(lieu)
-                    except (ValueError, IndexError):
-                        pass
-            
-            print(f"{len(self.liste_lieux)} lieux chargés depuis {nom_fichier}")
-            
-            if len(self.liste_lieux) != NB_LIEUX:
-                print(f"Incohérence: {len(self.liste_lieux)} lieux vs {NB_LIEUX} attendus")
-                NB_LIEUX = len(self.liste_lieux)
-                
+            extension = os.path.splitext(nom_fichier)[1].lower()
+            if extension == '.npy':
+                coordonnees = np.load(nom_fichier)
+            elif extension in ('.f32', '.bin'):
+                coordonnees = np.fromfile(nom_fichier, dtype=np.float32)
+            elif extension == '.tsp':
+                coordonnees = lire_tsplib(nom_fichier)
+            else:
+                coordonnees = lire_csv_coordonnees(nom_fichier)
+            coordonnees = np.ascontiguousarray(coordonnees, dtype=np.float64).reshape(-1, 2)
         except FileNotFoundError:
             print(f"❌ Fichier {nom_fichier} introuvable")
+            return
         except Exception as e:
             print(f"❌ Erreur: {e}")
-    
-    def calcul_matrice_cout_od(self):
-        """Calcule la matrice des distances entre tous les lieux."""
+            return
+
+        self.liste_lieux = ListeLieux(coordonnees)
+        self.definir_coordonnees(coordonnees)
+        print(f"{len(self.liste_lieux)} lieux chargés depuis {nom_fichier}")
+
+        if nb_attendu is not None and len(self.liste_lieux) != nb_attendu:
+            print(f"Incohérence: {len(self.liste_lieux)} lieux vs {nb_attendu} attendus")
+
+    def sauvegarder_coordonnees(self, chemin):
+        """Écrit les coordonnées en binaire : .npy (float64) ou float32 brut (.f32 / .bin)."""
+        if os.path.splitext(chemin)[1].lower() in ('.f32', '.bin'):
+            self.coordonnees.astype(np.float32).tofile(chemin)
+        else:
+            np.save(chemin, self.coordonnees)
+
+    def construire_coordonnees(self):
+        """Regroupe les coordonnées des lieux dans un tableau (n, 2) float64 contigu."""
+        if isinstance(self.liste_lieux, ListeLieux):
+            return self.definir_coordonnees(self.liste_lieux.coordonnees)
+        return self.definir_coordonnees(np.ascontiguousarray(
+            [(lieu.x, lieu.y) for lieu in self.liste_lieux], dtype=np.float64
+        ).reshape(-1, 2))
+
+    def definir_coordonnees(self, coordonnees):
+        """Enregistre le tableau des coordonnées (et ses copies en colonnes et en listes)."""
+        self.coordonnees = coordonnees
+        self._x = np.ascontiguousarray(coordonnees[:, 0])
+        self._y = np.ascontiguousarray(coordonnees[:, 1])
+        self._xs = self._x.tolist()
+        self._ys = self._y.tolist()
+        return self.coordonnees
+
+    def calcul_matrice_cout_od(self, taille_bloc=TAILLE_BLOC_MATRICE, sortie=None):
+        """
+        Calcule la matrice des distances entre tous les lieux.
+        Le calcul est vectorisé par blocs de lignes : la mémoire temporaire
+        reste bornée à quelques tableaux (taille_bloc, n) en float64.
+
+        Args:
+            taille_bloc (int): Nombre de lignes calculées par bloc
+            sortie (np.ndarray): Tableau (n, n) float32 à remplir (ex. np.memmap), optionnel
+        """
         n = len(self.liste_lieux)
         if n == 0:
             print("Impossible de calculer la matrice: liste_lieux est vide.")
             return None
+        if self.coordonnees is None or len(self.coordonnees) != n:
+            self.construire_coordonnees()
             
         # OPTIMISATION: float32 au lieu de float64 = 50% mémoire en moins
-        self.matrice_od = np.zeros((n, n), dtype=np.float32)
-        
-        for i in range(n):
-            for j in range(i + 1, n): 
-                dist = self.liste_lieux[i].distance(self.liste_lieux[j])
-                self.matrice_od[i][j] = dist
-                self.matrice_od[j][i] = dist
-        
+        self.matrice_od = np.empty((n, n), dtype=np.float32) if sortie is None else sortie
+        xs = self.coordonnees[:, 0]
+        ys = self.coordonnees[:, 1]
+        
+        for debut in range(0, n, taille_bloc):
+            fin = min(debut + taille_bloc, n)
+            # Même formule que Lieu.distance, en float64 puis arrondie en float32
+            dx = xs[debut:fin, None] - xs[None, :]
+            dy = ys[debut:fin, None] - ys[None, :]
+            dx *= dx
+            dy *= dy
+            dx += dy
+            np.sqrt(dx, out=dx)
+            self.matrice_od[debut:fin] = dx
+        
+        self.mode_direct = False
         print("Matrice des distances calculée.")
         return self.matrice_od
     
+    def empreinte(self):
+        """Empreinte (SHA-256 tronqué) des coordonnées, clé des fichiers de cache."""
+        if self.coordonnees is None:
+            self.construire_coordonnees()
+        coordonnees = np.ascontiguousarray(self.coordonnees, dtype=np.float64)
+        h = hashlib.sha256()
+        h.update(str(coordonnees.shape).encode())
+        h.update(coordonnees.tobytes())
+        return h.hexdigest()[:20]
+
+    def _chemin_cache(self, dossier, nom):
+        return os.path.join(dossier, f"{nom}_{self.empreinte()}_{len(self.liste_lieux)}.npy")
+
+    def charger_ou_calculer_matrice(self, dossier):
+        """
+        Ouvre la matrice persistée pour ces coordonnées en lecture seule (np.memmap),
+        ou la calcule directement dans un fichier .npy puis l'ouvre de la même façon.
+        Plusieurs processus ouvrant le même fichier partagent le cache de pages du système.
+
+        Args:
+            dossier (str): Dossier des fichiers de cache
+        """
+        os.makedirs(dossier, exist_ok=True)
+        chemin = self._chemin_cache(dossier, "matrice")
+        if os.path.exists(chemin):
+            self.matrice_od = np.load(chemin, mmap_mode='r')
+            self.mode_direct = False
+            print(f"Matrice des distances chargée depuis {chemin}.")
+            return self.matrice_od
+
+        n = len(self.liste_lieux)
+        temporaire = f"{chemin}.{os.getpid()}.tmp"
+        sortie = np.lib.format.open_memmap(temporaire, mode='w+', dtype=np.float32, shape=(n, n))
+        self.calcul_matrice_cout_od(sortie=sortie)
+        sortie.flush()
+        del sortie
+        os.replace(temporaire, chemin)  # Écriture atomique : jamais de fichier partiel
+        self.matrice_od = np.load(chemin, mmap_mode='r')
+        return self.matrice_od
+
+    def longueurs_tours(self, tours):
+        """
+        Longueurs de plusieurs tours en une seule opération vectorisée.
+        
+        Args:
+            tours (np.ndarray): Tableau (P, n+1) d'indices, chaque ligne fermée sur 0
+            
+        Returns:
+            np.ndarray: Vecteur (P,) des longueurs en float64
+        """
+        tours = np.asarray(tours, dtype=np.intp)
+        return self.distances_paires(tours[:, :-1], tours[:, 1:]).sum(axis=1, dtype=np.float64)
+
+    def longueur_tour(self, ordre):
+        """Longueur d'un ordre de visite fermé (avec ou sans matrice)."""
+        ordre = np.asarray(ordre, dtype=np.intp)
+        if len(ordre) < 2:
+            return 0.0
+        return float(self.distances_paires(ordre[:-1], ordre[1:]).sum(dtype=np.float64))
+
+    def distances_paires(self, i, j):
+        """
+        Distances entre les lieux i[k] et j[k] pour des tableaux d'indices de même forme.
+        Sans matrice, elles sont calculées à la volée depuis les coordonnées (mémoire O(n)),
+        par np.take sur les colonnes x et y contiguës et en place : deux fois plus vite
+        que l'indexation des lignes de coordonnees, et sans cache de lignes de la matrice
+        (aucun consommateur ne relit assez souvent les mêmes lignes pour l'amortir).
+        """
+        if not self.mode_direct:
+            return self.matrice_od[i, j]
+        dx = np.take(self._x, i)
+        dx -= np.take(self._x, j)
+        dy = np.take(self._y, i)
+        dy -= np.take(self._y, j)
+        dx *= dx
+        dy *= dy
+        dx += dy
+        return np.sqrt(dx)
+
     def get_distance(self, i, j):
         """Obtient distance entre lieux i et j (avec ou sans matrice)"""
         if self.mode_direct:
-            # Calcul direct
-            return self.liste_lieux[i].distance(self.liste_lieux[j])
+            # Calcul direct depuis les coordonnées
+            dx = self._xs[i] - self._xs[j]
+            dy = self._ys[i] - self._ys[j]
+            return math.sqrt(dx * dx + dy * dy)
         else:
-            return self.matrice_od[i][j]
+            return float(self.matrice_od[i, j])
 
     def plus_proche_voisin(self, indice_lieu, lieux_non_visites):
-        """Trouve le plus proche voisin d'un lieu donné."""
+        """Trouve le plus proche voisin d'un lieu donné (calcul vectorisé sur les candidats)."""
         if not lieux_non_visites:
             return None
         
-        distance_min = float('inf')
-        indice_plus_proche = None
+        candidats = np.fromiter(lieux_non_visites, dtype=np.intp, count=len(lieux_non_visites))
+        distances = self.distances_paires(indice_lieu, candidats)
+        return int(candidats[np.argmin(distances)])
+
+    def creer_index_spatial(self, lieux_par_cellule=2):
+        """Crée un index spatial (grille) sur tous les lieux du graphe."""
+        if self.coordonnees is None or len(self.coordonnees) != len(self.liste_lieux):
+            self.construire_coordonnees()
+        return GrilleSpatiale(self.coordonnees, lieux_par_cellule)
+
+    def calcul_voisins_candidats(self, k=NB_VOISINS_CANDIDATS):
+        """
+        Calcule (une seule fois par valeur de k) les listes de voisins candidats :
+        les k plus proches lieux de chaque lieu, triés par distance croissante.
+        
+        Args:
+            k (int): Nombre de voisins candidats par lieu
+            
+        Returns:
+            np.ndarray: Tableau (n, k) int32
+        """
+        k = min(k, len(self.liste_lieux) - 1)
+        if self.voisins_candidats is None or self.voisins_candidats.shape[1] != k:
+            chemin = None
+            if self.dossier_cache:
+                os.makedirs(self.dossier_cache, exist_ok=True)
+                chemin = self._chemin_cache(self.dossier_cache, f"voisins_k{k}")
+            if chemin and os.path.exists(chemin):
+                self.voisins_candidats = np.load(chemin, mmap_mode='r')
+            else:
+                index = self.creer_index_spatial(lieux_par_cellule=max(2, k // 2))
+                self.voisins_candidats = index.k_plus_proches(k)
+                if chemin:
+                    temporaire = f"{chemin}.{os.getpid()}.tmp"
+                    with open(temporaire, 'wb') as fichier:
+                        np.save(fichier, self.voisins_candidats)
+                    os.replace(temporaire, chemin)
+        return self.voisins_candidats
+
+    def tour_plus_proche_voisin(self, depart=0):
+        """
+        Construit le tour du plus proche voisin à l'aide de la grille spatiale.
         
-        for i in lieux_non_visites:
-            dist = self.get_distance(indice_lieu, i)
-            if dist < distance_min:
-                distance_min = dist
-                indice_plus_proche = i
+        Args:
+            depart (int): Lieu de départ (et d'arrivée) du tour
+            
+        Returns:
+            list: Ordre de visite [depart, ..., depart]
+        """
+        index = self.creer_index_spatial()
+        index.supprimer(depart)
+        ordre = [depart]
+        lieu_actuel = depart
+        
+        while index.nb_restants:
+            prochain = index.plus_proche(lieu_actuel)
+            index.supprimer(prochain)
+            ordre.append(prochain)
+            lieu_actuel = prochain
         
-        return indice_plus_proche
+        ordre.append(depart)
+        return ordre
 
 
 # ============================================================================
@@ -217,32 +689,561 @@ class Route:
     """
     Classe représentant une route traversant tous les lieux d'un graphe.
     La route commence et se termine au lieu 0 (point de départ).
+    L'ordre peut être une liste Python ou un tableau NumPy int32 (mode tableau).
     """
-    __slots__ = ('graph', 'ordre', '_distance_cache')  # Économie mémoire
-    def __init__(self, graph):
+    __slots__ = ('graph', 'ordre', '_distance_cache', '_empreinte')  # Économie mémoire
+    def __init__(self, graph, ordre=None):
         """
         Initialise une route pour un graphe donné.
         
         Args:
             graph (Graph): Le graphe contenant les lieux à visiter
+            ordre (list | np.ndarray): Ordre de visite initial (optionnel)
         """
         self.graph = graph
-        self.ordre = []  # Ordre de visite des lieux [0, 3, 8, 1, 2, 4, 6, 5, 9, 7, 0]
+        self.ordre = [] if ordre is None else ordre  # Ordre de visite des lieux [0, 3, 8, 1, 2, 4, 6, 5, 9, 7, 0]
         self._distance_cache = None
+        self._empreinte = None  # Empreinte canonique (IndexPopulation), None = à calculer
+
+    def vers_tableau(self):
+        """Convertit l'ordre de visite en tableau NumPy int32 (mode tableau)."""
+        if not isinstance(self.ordre, np.ndarray) or self.ordre.dtype != np.int32:
+            self.ordre = np.asarray(self.ordre, dtype=np.int32)
+        return self.ordre
 
     def calcul_distance_route(self):
+        """Longueur de la route : une seule lecture vectorisée des distances puis une somme."""
         if self._distance_cache is not None:
             return self._distance_cache
         
-        distance_totale = 0.0
-        for i in range(len(self.ordre) - 1):
-            lieu_depart = self.ordre[i]
-            lieu_arrivee = self.ordre[i + 1]
-            distance_totale += self.graph.matrice_od[lieu_depart][lieu_arrivee]
+        distance_totale = self.graph.longueur_tour(self.ordre)
         
         self._distance_cache = distance_totale
         return distance_totale
 
+    @staticmethod
+    def evaluer_population(routes):
+        """
+        Calcule en un seul appel la longueur de toutes les routes sans cache.
+        Les routes de même longueur sont empilées en un tableau (P, n+1)
+        évalué d'un bloc par Graph.longueurs_tours.
+        
+        Args:
+            routes (list): Liste de Route partageant le même graphe
+        """
+        a_evaluer = [r for r in routes if r._distance_cache is None]
+        if not a_evaluer:
+            return
+        tours = np.array([r.ordre for r in a_evaluer], dtype=np.intp)
+        longueurs = a_evaluer[0].graph.longueurs_tours(tours)
+        for route, longueur in zip(a_evaluer, longueurs):
+            route._distance_cache = float(longueur)
+
+# ============================================================================
+# CLASSE INDEX DE POPULATION
+#Détection exacte des doublons en O(1) : chaque route a une empreinte égale à la
+#somme (mod 2^64) des clés de ses arêtes non orientées. Elle ne dépend ni du lieu
+#de départ ni du sens de parcours, et une mutation la met à jour en O(1).
+# ============================================================================
+
+class IndexPopulation:
+    """
+    Ensemble des routes d'une population, indexées par empreinte canonique.
+    Deux routes de même empreinte sont comparées sur leur forme canonique :
+    le test de doublon est exact, même entre routes de même longueur.
+    """
+    MASQUE = (1 << 64) - 1
+
+    def __init__(self, nb_lieux, graine=0x7591):
+        """
+        Args:
+            nb_lieux (int): Nombre de lieux
+            graine (int): Graine des clés (identique d'un processus à l'autre)
+        """
+        generateur = np.random.default_rng(graine)
+        self.cles = generateur.integers(1, 2 ** 63, size=nb_lieux, dtype=np.uint64) | np.uint64(1)
+        self._cles = self.cles.tolist()
+        self.routes = {}  # Empreinte -> routes de cette empreinte
+        self.nb_routes = 0
+
+    def __len__(self):
+        return self.nb_routes
+
+    def vider(self):
+        self.routes.clear()
+        self.nb_routes = 0
+
+    def empreinte(self, route):
+        """Empreinte de la route (calculée une fois, vectorisée, puis conservée sur la route)."""
+        if route._empreinte is None:
+            cles = self.cles[np.asarray(route.ordre, dtype=np.intp)]
+            route._empreinte = int((cles[:-1] * cles[1:]).sum(dtype=np.uint64))
+        return route._empreinte
+
+    def remplacer_aretes(self, route, retirees, ajoutees):
+        """
+        Met à jour en O(1) l'empreinte d'une route modifiée en place.
+
+        Args:
+            route (Route): Route dont l'empreinte est connue
+            retirees (list): Arêtes (a, b) supprimées
+            ajoutees (list): Arêtes (a, b) créées
+        """
+        if route._empreinte is None:
+            return
+        cles = self._cles
+        h = route._empreinte
+        for a, b in retirees:
+            h -= cles[a] * cles[b]
+        for a, b in ajoutees:
+            h += cles[a] * cles[b]
+        route._empreinte = h & self.MASQUE
+
+    @staticmethod
+    def forme_canonique(ordre):
+        """Cycle commençant au lieu 0, parcouru vers le plus petit de ses deux voisins."""
+        cycle = np.asarray(ordre)[:-1]
+        debut = int(np.argmax(cycle == 0))
+        if debut:
+            cycle = np.roll(cycle, -debut)
+        if len(cycle) > 2 and cycle[1] > cycle[-1]:
+            cycle = np.concatenate((cycle[:1], cycle[:0:-1]))
+        return cycle
+
+    def _meme_cycle(self, route1, route2):
+        if route1 is route2:
+            return True
+        return np.array_equal(self.forme_canonique(route1.ordre), self.forme_canonique(route2.ordre))
+
+    def contient(self, route):
+        """Vrai si une route identique (au sens et au départ près) est indexée."""
+        return any(self._meme_cycle(autre, route) for autre in self.routes.get(self.empreinte(route), ()))
+
+    def ajouter(self, route):
+        """
+        Indexe la route si elle n'est pas déjà présente.
+
+        Returns:
+            bool: False si la route est un doublon
+        """
+        seau = self.routes.setdefault(self.empreinte(route), [])
+        if any(self._meme_cycle(autre, route) for autre in seau):
+            return False
+        seau.append(route)
+        self.nb_routes += 1
+        return True
+
+    def retirer(self, route):
+        """Retire la route (même objet) de l'index."""
+        seau = self.routes.get(self.empreinte(route))
+        if not seau:
+            return
+        for i, autre in enumerate(seau):
+            if autre is route:
+                del seau[i]
+                self.nb_routes -= 1
+                break
+        if not seau:
+            del self.routes[route._empreinte]
+
+    def diversite(self, population):
+        """
+        Indicateurs de diversité d'une population.
+
+        Returns:
+            dict: Proportion de routes distinctes, et nombre d'arêtes distinctes
+                rapporté au nombre de lieux (1.0 = toutes les routes identiques)
+        """
+        if not population:
+            return {"routes_distinctes": 0.0, "aretes_distinctes": 0.0}
+        tours = np.array([r.ordre for r in population], dtype=np.int64)
+        a = np.minimum(tours[:, :-1], tours[:, 1:])
+        b = np.maximum(tours[:, :-1], tours[:, 1:])
+        nb_lieux = len(self.cles)
+        aretes = np.unique(a * nb_lieux + b)
+        return {
+            "routes_distinctes": len(self) / len(population),
+            "aretes_distinctes": len(aretes) / nb_lieux,
+        }
+
+# ============================================================================
+# CLASSE RECHERCHE LOCALE
+#Moteur de recherche locale 2-opt / Or-opt sur listes de voisins candidats.
+#La route est stockée comme un cycle (liste tour + tableau position lieu -> indice),
+#les inversions se font sur le plus court des deux côtés du cycle, et des
+#"don't-look bits" (file des lieux actifs) évitent de retester les lieux stables.
+# ============================================================================
+
+class RechercheLocale:
+    """
+    Recherche locale 2-opt + Or-opt jusqu'à un optimum local,
+    avec budgets de temps et de nombre de mouvements.
+    """
+
+    def __init__(self, graph, k=NB_VOISINS_CANDIDATS, or_opt=True, longueur_segment_max=3):
+        """
+        Prépare le moteur pour un graphe.
+        
+        Args:
+            graph (Graph): Le graphe (coordonnées et voisins candidats)
+            k (int): Nombre de voisins candidats par lieu
+            or_opt (bool): Active les déplacements de segments Or-opt
+            longueur_segment_max (int): Longueur maximale des segments Or-opt
+        """
+        self.graph = graph
+        if graph.coordonnees is None:
+            graph.construire_coordonnees()
+        self.xs = graph._xs
+        self.ys = graph._ys
+        self.voisins = graph.calcul_voisins_candidats(k).tolist()
+        self.or_opt = or_opt
+        self.longueur_segment_max = longueur_segment_max
+        self.tour = []
+        self.position = []
+        self._dans_file = []  # Complément des don't-look bits, remis à False après chaque exécution
+        self.journal = None  # Liste des inversions (i, j) appliquées, si tenue (voir annuler)
+        self.nb_mouvements = 0  # Compteurs cumulés (instrumentation)
+        self.nb_examens = 0
+
+    def distance(self, i, j):
+        """Distance euclidienne entre les lieux i et j (sans matrice)."""
+        return math.hypot(self.xs[i] - self.xs[j], self.ys[i] - self.ys[j])
+
+    # ----- Représentation du cycle -----
+
+    def charger(self, ordre):
+        """Charge un ordre de visite fermé [0, ..., 0] comme cycle."""
+        self.tour = [int(v) for v in ordre[:-1]]
+        self.position = [0] * len(self.tour)
+        for p, ville in enumerate(self.tour):
+            self.position[ville] = p
+        self._dans_file = [False] * len(self.tour)
+
+    def ordre_ferme(self, depart=0):
+        """Renvoie le cycle sous forme d'ordre fermé commençant et finissant par depart."""
+        p = self.position[depart]
+        ordre = self.tour[p:] + self.tour[:p]
+        ordre.append(depart)
+        return ordre
+
+    def suivant(self, ville):
+        p = self.position[ville] + 1
+        return self.tour[0 if p == len(self.tour) else p]
+
+    def precedent(self, ville):
+        return self.tour[self.position[ville] - 1]
+
+    def _inverser(self, i, j):
+        """Inverse le chemin des positions i à j (sens direct), ou son complément s'il est plus court."""
+        tour, position = self.tour, self.position
+        if self.journal is not None:
+            self.journal.append((i, j))
+        n = len(tour)
+        longueur = (j - i) % n + 1
+        if 2 * longueur > n:
+            i, j = (j + 1) % n, (i - 1) % n
+            longueur = n - longueur
+        for _ in range(longueur // 2):
+            vi, vj = tour[i], tour[j]
+            tour[i] = vj
+            position[vj] = i
+            tour[j] = vi
+            position[vi] = j
+            i += 1
+            if i == n:
+                i = 0
+            j -= 1
+            if j < 0:
+                j = n - 1
+
+    def _echanger_aretes(self, a, b, c, d):
+        """Remplace les arêtes (a, b) et (c, d) par (a, c) et (b, d)."""
+        if self.suivant(a) == b:
+            self._inverser(self.position[b], self.position[c])
+        else:
+            self._inverser(self.position[a], self.position[d])
+
+    def annuler(self, journal):
+        """
+        Défait les inversions d'un journal (la plus récente d'abord) : une inversion
+        rejouée sur les mêmes positions choisit le même côté et s'annule elle-même.
+        """
+        en_cours, self.journal = self.journal, None
+        for i, j in reversed(journal):
+            self._inverser(i, j)
+        self.journal = en_cours
+
+    # ----- Mouvements -----
+
+    def _essayer_2opt(self, a):
+        """Cherche un mouvement 2-opt améliorant autour de a ; renvoie les lieux touchés."""
+        distance = self.distance
+        for sens_direct in (True, False):
+            b = self.suivant(a) if sens_direct else self.precedent(a)
+            d_ab = distance(a, b)
+            for c in self.voisins[a]:
+                d_ac = distance(a, c)
+                if d_ac >= d_ab:
+                    break  # Voisins triés : plus aucun gain possible
+                d = self.suivant(c) if sens_direct else self.precedent(c)
+                if c == b or d == a:
+                    continue
+                gain = d_ab + distance(c, d) - d_ac - distance(b, d)
+                if gain > 1e-9:
+                    self._echanger_aretes(a, b, c, d)
+                    return (a, b, c, d), gain
+        return None, 0.0
+
+    def _essayer_or_opt(self, a):
+        """Cherche un déplacement Or-opt améliorant d'un segment contenant a."""
+        distance = self.distance
+        for longueur in range(1, self.longueur_segment_max + 1):
+            if longueur + 3 > len(self.tour):
+                break
+            for sens_direct in (True, False):
+                # Segment s1..s2 de `longueur` lieux (sens direct), se terminant ou commençant en a
+                s1 = s2 = a
+                for _ in range(longueur - 1):
+                    if sens_direct:
+                        s2 = self.suivant(s2)
+                    else:
+                        s1 = self.precedent(s1)
+                segment = set()
+                v = s1
+                for _ in range(longueur):
+                    segment.add(v)
+                    v = self.suivant(v)
+                p, n = self.precedent(s1), self.suivant(s2)
+                gain_retrait = distance(p, s1) + distance(s2, n) - distance(p, n)
+                if gain_retrait <= 1e-9:
+                    continue
+                
+                for extremite in (s1, s2):
+                    for c in self.voisins[extremite]:
+                        if distance(extremite, c) >= gain_retrait:
+                            break
+                        if c in segment:
+                            continue
+                        for e, f in ((c, self.suivant(c)), (self.precedent(c), c)):
+                            if e in segment or f in segment or e == n or f == p:
+                                continue
+                            d_ef = distance(e, f)
+                            cout_normal = distance(e, s1) + distance(s2, f) - d_ef
+                            cout_inverse = distance(e, s2) + distance(s1, f) - d_ef
+                            inverse = cout_inverse < cout_normal
+                            gain = gain_retrait - (cout_inverse if inverse else cout_normal)
+                            if gain > 1e-9:
+                                # Trois échanges d'arêtes : p s1..s2 n X e f -> p n X e s1..s2 f
+                                self._echanger_aretes(p, s1, e, f)
+                                self._echanger_aretes(p, e, n, s2)
+                                if not inverse:
+                                    self._echanger_aretes(e, s2, s1, f)
+                                return (p, n, s1, s2, e, f), gain
+        return None, 0.0
+
+    def executer(self, villes_actives=None, temps_max=None, max_mouvements=None):
+        """
+        Applique des mouvements améliorants jusqu'à l'optimum local ou l'épuisement d'un budget.
+        
+        Args:
+            villes_actives (iterable): Lieux à examiner au départ (tous par défaut)
+            temps_max (float): Budget de temps en secondes (None = illimité)
+            max_mouvements (int): Nombre maximal de mouvements appliqués (None = illimité)
+            
+        Returns:
+            float: Gain total obtenu
+        """
+        if len(self.tour) < 5:
+            return 0.0
+        file = deque(self.tour if villes_actives is None else villes_actives)
+        if len(self._dans_file) != len(self.tour):
+            self._dans_file = [False] * len(self.tour)
+        dans_file = self._dans_file  # Réutilisé : pas d'allocation O(n) par appel
+        for v in file:
+            dans_file[v] = True
+        
+        gain_total = 0.0
+        mouvements = 0
+        echeance = None if temps_max is None else time.time() + temps_max
+        compteur = 0
+        
+        while file:
+            compteur += 1
+            if echeance is not None and compteur % 256 == 0 and time.time() > echeance:
+                break
+            a = file.popleft()
+            dans_file[a] = False
+            
+            touches, gain = self._essayer_2opt(a)
+            if touches is None and self.or_opt:
+                touches, gain = self._essayer_or_opt(a)
+            if touches is None:
+                continue
+            
+            gain_total += gain
+            mouvements += 1
+            for v in touches:
+                if not dans_file[v]:
+                    dans_file[v] = True
+                    file.append(v)
+            if not dans_file[a]:
+                dans_file[a] = True
+                file.append(a)
+            if max_mouvements is not None and mouvements >= max_mouvements:
+                break
+        for v in file:
+            dans_file[v] = False
+        
+        self.nb_mouvements += mouvements
+        self.nb_examens += compteur
+        return gain_total
+
+    def optimiser(self, route, temps_max=None, max_mouvements=None, villes_actives=None):
+        """
+        Optimise une route sur place (liste ou tableau int32) et met à jour sa longueur.
+        
+        Returns:
+            float: Gain total obtenu
+        """
+        self.charger(route.ordre)
+        gain = self.executer(villes_actives, temps_max, max_mouvements)
+        if gain > 0:
+            ordre = self.ordre_ferme(route.ordre[0])
+            route.ordre[:] = ordre
+            route._distance_cache = None
+            route._empreinte = None
+        return gain
+
+
+# ============================================================================
+# SOLVEUR EXACT (HELD-KARP)
+#Programmation dynamique sur les sous-ensembles : cout[k, S] est la longueur du
+#plus court chemin partant de 0, visitant exactement S et finissant en k.
+#Les sous-ensembles d'une même taille sont traités ensemble (NumPy), en disposition
+#(k, S) : pour un k fixé, les S précédents sont croissants, la lecture est quasi
+#séquentielle et le minimum se prend sur l'axe long. Les chemins ne sont calculés
+#que jusqu'à la moitié des lieux ; la tournée joint deux demi-chemins partant de 0
+#(S et son complément), et le prédécesseur est recalculé au seul moment de la remontée.
+#Temps O(2^n n^2), mémoire 2^(n-1) (n-1) x 4 octets : ~40 Mo et ~0,35 s pour 20 lieux.
+# ============================================================================
+
+def held_karp(graph):
+    """
+    Route optimale par l'algorithme de Held-Karp (petites instances uniquement).
+
+    Args:
+        graph (Graph): Graphe d'au plus une vingtaine de lieux
+
+    Returns:
+        tuple: (ordre fermé [0, ..., 0] optimal, longueur)
+    """
+    if graph.coordonnees is None:
+        graph.construire_coordonnees()
+    n = len(graph.coordonnees)
+    if n <= 3:
+        ordre = list(range(n)) + [0]
+        return ordre, graph.longueur_tour(ordre)
+    
+    diff = graph.coordonnees[:, None, :] - graph.coordonnees[None, :, :]
+    distances = np.sqrt((diff * diff).sum(axis=2))
+    
+    m = n - 1  # Lieux 1..n-1, le bit k représentant le lieu k + 1
+    taille = 1 << m
+    moitie = m // 2  # Taille des sous-ensembles S de la jonction (le complément en a m - moitie)
+    cout = np.full((m, taille), np.inf, dtype=np.float32)
+    cout[np.arange(m), 1 << np.arange(m)] = distances[0, 1:]
+    
+    # Sous-ensembles regroupés par nombre d'éléments (croissants dans chaque groupe)
+    masques = np.arange(taille, dtype=np.int32)
+    nb_elements = np.zeros(taille, dtype=np.int8)
+    for bit in range(m):
+        nb_elements += (masques >> bit) & 1
+    par_taille = np.argsort(nb_elements, kind="stable").astype(np.int32)
+    bornes = np.searchsorted(nb_elements[par_taille], np.arange(m + 2))
+    
+    distances_internes = distances[1:, 1:].astype(np.float32)
+    for nb in range(2, m - moitie + 1):
+        couche = par_taille[bornes[nb]:bornes[nb + 1]]
+        for k in range(m):
+            sous_ensembles = couche[(couche >> k) & 1 == 1]
+            # S contient k : S - 2^k = S \ {k} reste croissant (lecture ordonnée)
+            valeurs = np.take(cout, sous_ensembles - (1 << k), axis=1)
+            valeurs += distances_internes[:, k, None]
+            cout[k, sous_ensembles] = valeurs.min(axis=0)
+    
+    # Jonction : 0 -> S -> k, arête (k, l), puis l -> complément de S -> 0 parcouru à rebours
+    plein = taille - 1
+    moities = par_taille[bornes[moitie]:bornes[moitie + 1]]
+    aller = np.take(cout, moities, axis=1)
+    total = np.take(cout, plein ^ moities, axis=1)
+    for l in range(m):
+        total[l] += (aller + distances_internes[:, l, None]).min(axis=0)
+    l, q = np.unravel_index(int(np.argmin(total)), total.shape)
+    masque = int(moities[q])
+    k = int(np.argmin(aller[:, q] + distances_internes[:, l]))
+    
+    def remonter(masque, k):
+        """Chemin 0 -> ... -> k visitant masque (prédécesseurs recalculés)."""
+        chemin = [k]
+        while masque != 1 << k:
+            masque ^= 1 << k
+            k = int(np.argmin(cout[:, masque] + distances_internes[:, k]))
+            chemin.append(k)
+        return chemin[::-1]
+    
+    chemin = remonter(masque, k) + remonter(plein ^ masque, int(l))[::-1]
+    ordre = [0] + [v + 1 for v in chemin] + [0]
+    return ordre, graph.longueur_tour(ordre)
+
+
+# ============================================================================
+# INSTANTANÉS ET BOÎTE AUX LETTRES (THREAD GA -> THREAD TK)
+#Le thread de l'algorithme ne confie jamais d'objets vivants à l'interface : il
+#dépose une copie figée des routes dans une boîte à une place, lue par le thread Tk.
+# ============================================================================
+
+class InstantaneRoute:
+    """Copie figée d'une route : ordre int32 en lecture seule et longueur."""
+    __slots__ = ('ordre', 'distance')
+
+    def __init__(self, ordre, distance):
+        self.ordre = np.array(ordre, dtype=np.int32)  # Copie
+        self.ordre.flags.writeable = False
+        self.distance = distance
+
+    @classmethod
+    def depuis_route(cls, route):
+        return cls(route.ordre, route._distance_cache)
+
+
+class BoiteAuxLettres:
+    """
+    Boîte à une place sans verrou, pour un producteur et un consommateur.
+    Chaque dépôt remplace le précédent ; le contenu (version, valeur) est un seul
+    tuple, remplacé et lu en une affectation atomique.
+    """
+
+    def __init__(self):
+        self._contenu = (0, None)
+        self.version_lue = 0  # Écrite par le seul consommateur
+
+    def deposer(self, valeur):
+        """Dépose une valeur (producteur), en remplaçant celle non lue."""
+        self._contenu = (self._contenu[0] + 1, valeur)
+
+    def retirer(self):
+        """Renvoie la dernière valeur déposée si elle n'a pas été lue (consommateur), sinon None."""
+        version, valeur = self._contenu
+        if version == self.version_lue:
+            return None
+        self.version_lue = version
+        return valeur
+
+    def est_lue(self):
+        """Vrai si le consommateur a lu le dernier dépôt (un nouveau dépôt ne sera pas perdu)."""
+        return self._contenu[0] == self.version_lue
+
+
 # ============================================================================
 # CLASSE AFFICHAGE
 # ============================================================================
@@ -270,8 +1271,20 @@ class Affichage:
         self.nb_lieux_total = len(graph.liste_lieux)
         self.echantillonner = self.nb_lieux_total > 1000
         self.taux_echantillon = max(0.1, min(1.0, 1000 / self.nb_lieux_total))
+        
+        # Rendu : une polyligne par route, modifiée sur place, au plus images_par_seconde fois par seconde
+        # (seul _sonder déclenche un dessin, depuis la boîte aux lettres)
+        self.images_par_seconde = 20
+        self.ligne_meilleure = None  # Identifiant Canvas de la polyligne de la meilleure route
+        self.lignes_secondaires = []
+        
+        # Réception depuis le thread de l'algorithme (aucun appel Tk hors du thread Tk)
+        self.boite_routes = BoiteAuxLettres()  # (meilleure, secondaires) en InstantaneRoute
+        self.messages = queue.SimpleQueue()
 
         # Création de la fenêtre principale
+        if tk is None:
+            raise RuntimeError("Tkinter n'est pas disponible : utiliser le mode sans affichage (resoudre).")
         self.root = tk.Tk()
         self.root.title(titre)
         
@@ -302,6 +1315,7 @@ class Affichage:
         self.ajouter_texte("Interface initialisée.\n")
         self.ajouter_texte("Appuyez sur ESPACE pour afficher/masquer les routes secondaires.\n")
         self.ajouter_texte("Appuyez sur ESC pour quitter.\n")
+        self.root.after(0, self._sonder)
     
     def afficher_lieux(self):
         """
@@ -324,46 +1338,43 @@ class Affichage:
                 self.canvas.create_text(x, y, text=str(i),
                                         font=("Arial", font_size, "bold"))
 
-    def afficher_route(self, route, couleur="blue", style="", largeur=None, afficher_ordre=True, tag=None):
-        if not route or not route.ordre:
-            return
+    def coordonnees_route(self, route):
+        """
+        Coordonnées aplaties [x0, y0, x1, y1, ...] de la route pour Canvas.
+        Sur les grands graphes (echantillonner), seul un lieu sur 1 / taux_echantillon
+        est conservé, plus le lieu d'arrivée pour refermer la route.
+        """
+        ordre = np.asarray(route.ordre, dtype=np.intp)
+        if self.echantillonner:
+            pas = max(1, round(1 / self.taux_echantillon))
+            ordre = np.append(ordre[:-1:pas], ordre[-1])
+        if self.graph.coordonnees is None:
+            self.graph.construire_coordonnees()
+        return self.graph.coordonnees[ordre].ravel().tolist()
+
+    def afficher_route(self, route, couleur="blue", style="", largeur=None, afficher_ordre=True, tag=None,
+                       ligne=None):
+        """
+        Dessine la route en une seule polyligne, ou met à jour sur place la polyligne existante.
         
-        dash_config = (5, 5) if style == "dash" else ()
-        n = len(self.graph.liste_lieux)
-        if largeur is None:
-            largeur = max(1, 3 - n // 100)
-
-        for i in range(len(route.ordre) - 1):
-            lieu_depart = self.graph.liste_lieux[route.ordre[i]]
-            lieu_arrivee = self.graph.liste_lieux[route.ordre[i + 1]]
-            
-            self.canvas.create_line(lieu_depart.x, lieu_depart.y,
-                                    lieu_arrivee.x, lieu_arrivee.y,
-                                    fill=couleur, width=largeur, dash=dash_config,
-                                    tags=tag)
-
-    
-    def afficher_meilleure_route(self, route):
+        Returns:
+            int: Identifiant Canvas de la polyligne (None si la route est vide)
         """
-        Affiche la meilleure route trouvée en bleu pointillé.
+        if not route or len(route.ordre) == 0:
+            return None
         
-        Args:
-            route (Route): La meilleure route à afficher
-        """
-        self.meilleure_route = route
-        self.rafraichir_affichage()
-    
-    def afficher_routes_secondaires(self, routes):
-        """
-        Stocke les N meilleures routes pour affichage optionnel.
+        points = self.coordonnees_route(route)
+        if ligne is not None:
+            self.canvas.coords(ligne, points)
+            self.canvas.itemconfigure(ligne, state="normal")
+            return ligne
         
-        Args:
-            routes (list): Liste de Route à afficher en gris clair
-        """
-        self.routes_population = routes
-        if self.afficher_population:
-            self.rafraichir_affichage()
-    
+        dash_config = (5, 5) if style == "dash" else ()
+        n = len(self.graph.liste_lieux)
+        if largeur is None:
+            largeur = max(1, 3 - n // 100)
+        return self.canvas.create_line(points, fill=couleur, width=largeur, dash=dash_config, tags=tag)
+
     def toggle_population(self, event=None):
         """
         Active/désactive l'affichage des routes secondaires.
@@ -372,19 +1383,50 @@ class Affichage:
         self.rafraichir_affichage()
         
     def rafraichir_affichage(self):
-        # Supprimer uniquement les routes existantes
-        self.canvas.delete("route")  # On utilise un tag 'route' pour toutes les lignes
-
-        # Affichage des routes secondaires si activé
-        if self.afficher_population:
-            for route in self.routes_population:
-                self.afficher_route(route, couleur="lightgray", largeur=1, afficher_ordre=False, tag="route")
-        
-        # Affichage de la meilleure route
+        """Met à jour sur place les polylignes des routes (sans les recréer)."""
+        # Routes secondaires (masquées si désactivées)
+        routes = self.routes_population if self.afficher_population else []
+        for i, route in enumerate(routes):
+            ligne = self.lignes_secondaires[i] if i < len(self.lignes_secondaires) else None
+            ligne = self.afficher_route(route, couleur="lightgray", largeur=1, afficher_ordre=False,
+                                        tag="route", ligne=ligne)
+            if i >= len(self.lignes_secondaires) and ligne is not None:
+                self.lignes_secondaires.append(ligne)
+        for ligne in self.lignes_secondaires[len(routes):]:
+            self.canvas.itemconfigure(ligne, state="hidden")
+        
+        # Meilleure route, au-dessus des routes secondaires
         if self.meilleure_route:
-            self.afficher_route(self.meilleure_route, couleur="blue", style="dash", largeur=2, afficher_ordre=True, tag="route")
+            self.ligne_meilleure = self.afficher_route(self.meilleure_route, couleur="blue", style="dash",
+                                                       largeur=2, afficher_ordre=True, tag="route",
+                                                       ligne=self.ligne_meilleure)
+            self.canvas.tag_raise(self.ligne_meilleure)
+
+    def _sonder(self):
+        """Lit la boîte aux lettres et les messages (thread Tk), au rythme des images."""
+        depot = self.boite_routes.retirer()
+        if depot is not None:
+            meilleure, secondaires = depot
+            self.meilleure_route = meilleure
+            if secondaires is not None:
+                self.routes_population = secondaires
+            self.rafraichir_affichage()
+        while True:
+            try:
+                texte = self.messages.get_nowait()
+            except queue.Empty:
+                break
+            self.ajouter_texte(texte)
+        self.root.after(int(1000 / self.images_par_seconde), self._sonder)
+
+    def publier_routes(self, meilleure, secondaires=None):
+        """Dépose des instantanés à afficher (depuis n'importe quel thread)."""
+        self.boite_routes.deposer((meilleure, secondaires))
+
+    def publier_texte(self, texte):
+        """Ajoute un message à afficher (depuis n'importe quel thread)."""
+        self.messages.put(texte)
 
-    
     def ajouter_texte(self, texte):
         """
         Ajoute du texte dans la zone d'information.
@@ -409,6 +1451,216 @@ class Affichage:
         """
         self.root.mainloop()
 
+# ============================================================================
+# INSTRUMENTATION
+#Minuteries et compteurs par opérateur (sélection, crossover, mutation, 2-opt,
+#doublons, tri, observateurs...), désactivés par défaut pour un coût quasi nul.
+# ============================================================================
+
+class Profileur:
+    """
+    Temps cumulé et nombre d'appels par phase, et compteurs libres.
+    Inactif, debut() renvoie 0.0 et fin() / compter() ne font rien.
+    """
+
+    def __init__(self, actif=False):
+        self.actif = actif
+        self.temps = {}
+        self.appels = {}
+        self.compteurs = {}
+
+    def debut(self):
+        """Instant de début d'une phase (à passer à fin)."""
+        return time.perf_counter() if self.actif else 0.0
+
+    def fin(self, phase, debut):
+        """Ajoute la durée écoulée depuis debut au temps de la phase."""
+        if self.actif:
+            self.temps[phase] = self.temps.get(phase, 0.0) + time.perf_counter() - debut
+            self.appels[phase] = self.appels.get(phase, 0) + 1
+
+    def compter(self, nom, valeur=1):
+        if self.actif:
+            self.compteurs[nom] = self.compteurs.get(nom, 0) + valeur
+
+    def reinitialiser(self):
+        self.temps.clear()
+        self.appels.clear()
+        self.compteurs.clear()
+
+    def instantane(self):
+        """Copie des temps, appels et compteurs (pour calculer des écarts)."""
+        return dict(self.temps), dict(self.appels), dict(self.compteurs)
+
+    def resume(self, depuis=None):
+        """
+        Résumé des mesures, cumulé ou depuis un instantané.
+
+        Args:
+            depuis (tuple): Instantané précédent (voir instantane), optionnel
+
+        Returns:
+            dict: Temps et appels par phase, compteurs et gain du 2-opt par seconde
+        """
+        temps0, appels0, compteurs0 = depuis or ({}, {}, {})
+        phases = {}
+        for phase, temps in self.temps.items():
+            appels = self.appels[phase] - appels0.get(phase, 0)
+            if appels:
+                phases[phase] = {"temps": temps - temps0.get(phase, 0.0), "appels": appels}
+        compteurs = {nom: valeur - compteurs0.get(nom, 0) for nom, valeur in self.compteurs.items()
+                     if valeur != compteurs0.get(nom, 0)}
+        resume = {"phases": phases, "compteurs": compteurs}
+        temps_2opt = sum(mesure["temps"] for phase, mesure in phases.items() if phase.startswith("2opt"))
+        if temps_2opt > 0:
+            resume["gain_2opt_par_seconde"] = compteurs.get("gain_2opt", 0.0) / temps_2opt
+        return resume
+
+
+# ============================================================================
+# OBSERVATEURS DE PROGRESSION
+#TSP_GA ne dépend pas de l'affichage : il notifie une liste d'observateurs
+#(interface Tkinter, console, journal...) au début, à chaque itération et à la fin.
+# ============================================================================
+
+class ObservateurProgression:
+    """
+    Interface des observateurs de TSP_GA. Toutes les méthodes sont optionnelles :
+    les sous-classes ne redéfinissent que celles qui les intéressent.
+    """
+
+    def initialisation(self, tsp_ga, route_heuristique, distance_avant, distance_apres):
+        """Appelée après la construction de la route heuristique (et son 2-opt)."""
+
+    def debut(self, tsp_ga, nb_iterations):
+        """Appelée au lancement de la boucle des générations."""
+
+    def iteration(self, tsp_ga, iteration, amelioration):
+        """Appelée après chaque génération."""
+
+    def fin(self, tsp_ga, temps_total):
+        """Appelée à la fin de l'exécution."""
+
+
+class ObservateurConsole(ObservateurProgression):
+    """Affiche les améliorations et le résultat final sur la sortie standard."""
+
+    def __init__(self):
+        self.nb_iterations = 0
+
+    def debut(self, tsp_ga, nb_iterations):
+        self.nb_iterations = nb_iterations
+        print(f"Algorithme génétique: {nb_iterations} itérations")
+
+    def iteration(self, tsp_ga, iteration, amelioration):
+        if amelioration:
+            print(f"Iter {iteration:3d}/{self.nb_iterations} | "
+                  f"Best: {tsp_ga.meilleure_distance:7.2f} | "
+                  f"Found: iter {tsp_ga.iteration_meilleure:3d}")
+
+    def fin(self, tsp_ga, temps_total):
+        print(f"=== RÉSULTAT FINAL === Meilleure distance: {tsp_ga.meilleure_distance:.2f} "
+              f"(itération {tsp_ga.iteration_meilleure}, {temps_total:.2f}s)")
+
+
+class ObservateurStatistiques(ObservateurProgression):
+    """
+    Écrit une ligne JSON par génération : meilleure distance, durée, diversité
+    et, si le profileur est actif, les mesures de la génération.
+    """
+
+    def __init__(self, chemin):
+        """
+        Args:
+            chemin (str): Fichier JSON lines de sortie (écrasé au début de l'exécution)
+        """
+        self.chemin = chemin
+        self.fichier = None
+        self.instant = None
+        self.temps_precedent = None
+
+    def debut(self, tsp_ga, nb_iterations):
+        self.fichier = open(self.chemin, 'w', encoding='utf-8')
+        self.instant = tsp_ga.profileur.instantane()
+        self.temps_precedent = time.perf_counter()
+
+    def iteration(self, tsp_ga, iteration, amelioration):
+        import json
+
+        maintenant = time.perf_counter()
+        ligne = {
+            "iteration": iteration,
+            "meilleure_distance": tsp_ga.meilleure_distance,
+            "distance_generation": tsp_ga.population[0]._distance_cache if tsp_ga.population else None,
+            "amelioration": bool(amelioration),
+            "duree": maintenant - self.temps_precedent,
+            "routes_distinctes": tsp_ga.taux_routes_distinctes(),
+        }
+        if tsp_ga.profileur.actif:
+            ligne["profil"] = tsp_ga.profileur.resume(self.instant)
+            self.instant = tsp_ga.profileur.instantane()
+        self.fichier.write(json.dumps(ligne) + "\n")
+        self.temps_precedent = maintenant
+
+    def fin(self, tsp_ga, temps_total):
+        if self.fichier is not None:
+            self.fichier.close()
+            self.fichier = None
+
+
+class ObservateurAffichage(ObservateurProgression):
+    """
+    Relaie la progression vers une fenêtre Affichage : instantanés des routes
+    dans sa boîte aux lettres, textes dans sa file de messages (sans appel Tk).
+    """
+
+    def __init__(self, affichage, nb_secondaires=9):
+        self.affichage = affichage
+        self.nb_secondaires = nb_secondaires
+        self.nb_iterations = 0
+
+    def initialisation(self, tsp_ga, route_heuristique, distance_avant, distance_apres):
+        self.affichage.publier_routes(InstantaneRoute.depuis_route(route_heuristique))
+        self.affichage.publier_texte(f"Route heuristique: {distance_avant:.2f}\n")
+        if tsp_ga.activer_2opt:
+            self.affichage.publier_texte(f"Après 2-opt: {distance_apres:.2f}\n")
+
+    def debut(self, tsp_ga, nb_iterations):
+        self.nb_iterations = nb_iterations
+        self.affichage.publier_texte(f"Algorithme génétique: {nb_iterations} itérations\n\n")
+
+    def actualiser(self, tsp_ga, forcer=False):
+        """
+        Dépose un instantané de la meilleure route (et des suivantes si elles sont affichées).
+        Tant que l'interface n'a pas lu le précédent, aucune copie n'est faite, sauf si forcer.
+        """
+        if tsp_ga.meilleure_route is None:
+            return
+        if not forcer and not self.affichage.boite_routes.est_lue():
+            return
+        meilleure = InstantaneRoute.depuis_route(tsp_ga.meilleure_route)
+        secondaires = None
+        if self.affichage.afficher_population:
+            secondaires = [InstantaneRoute.depuis_route(route)
+                           for route in tsp_ga.population[:self.nb_secondaires + 1]
+                           if route is not tsp_ga.meilleure_route][:self.nb_secondaires]
+        self.affichage.publier_routes(meilleure, secondaires)
+
+    def iteration(self, tsp_ga, iteration, amelioration):
+        if iteration % tsp_ga.frequence_affichage == 0 or amelioration or iteration == self.nb_iterations:
+            self.actualiser(tsp_ga)
+
+            if amelioration:
+                self.affichage.publier_texte(f"Iter {iteration:3d}/{self.nb_iterations} | "
+                                             f"Best: {tsp_ga.meilleure_distance:7.2f} | "
+                                             f"Found: iter {tsp_ga.iteration_meilleure:3d}\n")
+
+    def fin(self, tsp_ga, temps_total):
+        self.actualiser(tsp_ga, forcer=True)
+        self.affichage.publier_texte(f"\n=== RÉSULTAT FINAL ===\n"
+                                     f"Meilleure distance: {tsp_ga.meilleure_distance:.2f}\n"
+                                     f"Trouvée: itération {tsp_ga.iteration_meilleure}\n")
+
 # ============================================================================
 # CLASSE TSP_GA
 # ============================================================================
@@ -418,12 +1670,54 @@ TSP_GA avec affichage dans UNE SEULE fenêtre
 L'affichage se met à jour pendant l'exécution
 """
 
+PARAMETRES_POINT_REPRISE = (  # Attributs de TSP_GA enregistrés dans les points de reprise
+    "taille_population", "nb_elite", "taux_mutation", "taux_crossover", "type_mutation",
+    "type_crossover", "activer_2opt", "max_mouvements_2opt_enfant", "max_stagnation", "distance_cible",
+)
+
+
 class TSP_GA:
 
-    def __init__(self, graph, affichage):
+    def __init__(self, graph, affichage=None, mode_tableau=False, observateurs=None):
         self.graph = graph
         self.affichage = affichage
+        self.observateurs = list(observateurs or [])
+        if affichage is not None:
+            self.observateurs.append(ObservateurAffichage(affichage))
         self.nb_lieux = len(graph.liste_lieux)
+        self.mode_tableau = mode_tableau  # Routes stockées en tableaux NumPy int32
+        self.recherche_locale = None  # Moteur 2-opt / Or-opt, créé au premier besoin
+        self.type_mutation = "swap"  # "swap", "inversion" ou "insertion"
+        self.type_crossover = "ox"  # "ox" ou "erx" (recombinaison d'arêtes)
+        self._villes_utilisees = None  # Masque booléen réutilisé par les crossovers
+        self.index_population = IndexPopulation(self.nb_lieux)  # Doublons en O(1)
+        self.profileur = Profileur()  # Minuteries et compteurs (inactif par défaut)
+        self.pool = None  # Pool de processus (génération parallèle, optionnelle)
+        self.memoire_partagee = None
+        self.nb_processus = 1
+        
+        # Budgets de la recherche locale (None = jusqu'à l'optimum local)
+        self.temps_max_2opt = 30.0  # Secondes, sur la route heuristique
+        self.temps_max_2opt_enfant = None
+        self.max_mouvements_2opt_enfant = max(50, self.nb_lieux // 4)
+        self.limite_2opt_enfant = LIMITE_2OPT_ENFANT  # Relevée dans les processus du pool
+        
+        # Critères d'arrêt (None = inactif)
+        self.echeance = None  # Instant (time.time()) où la meilleure route doit être rendue
+        self.part_temps_2opt = 0.5  # Part du temps restant accordée au 2-opt initial
+        self.max_stagnation = None  # Générations sans amélioration avant arrêt
+        self.distance_cible = None  # Longueur suffisante pour s'arrêter
+        self.raison_arret = None
+        self.seuil_exact = SEUIL_HELD_KARP  # Nombre de lieux jusqu'auquel executer() résout exactement
+        self.duree_generation = 0.0  # Durée lissée d'une génération (prévision de l'échéance)
+        
+        # Points de reprise (None = désactivés)
+        self.chemin_reprise = None
+        self.intervalle_reprise = 30.0  # Secondes minimales entre deux écritures
+        self._derniere_reprise = 0.0
+        self._empreinte_graphe = None
+        self.iteration_depart = 1  # Première génération du prochain executer() (> 1 après reprise)
+        self.nb_iterations_execution = None
         
         self._configurer_parametres()
         
@@ -485,7 +1779,7 @@ class TSP_GA:
             self.taux_crossover = 0.6
             self.nb_iterations_max = 50
             self.frequence_affichage = 5
-            self.activer_2opt = False
+            self.activer_2opt = True
         elif n <= 10000:
             self.taille_population = 10
             self.nb_elite = 2
@@ -493,7 +1787,7 @@ class TSP_GA:
             self.taux_crossover = 0.5
             self.nb_iterations_max = 30
             self.frequence_affichage = 3
-            self.activer_2opt = False
+            self.activer_2opt = True
         elif n <= 50000:
             self.taille_population = 8
             self.nb_elite = 1
@@ -501,7 +1795,7 @@ class TSP_GA:
             self.taux_crossover = 0.4
             self.nb_iterations_max = 20
             self.frequence_affichage = 2
-            self.activer_2opt = False
+            self.activer_2opt = True
         else:  # > 50 000
             self.taille_population = 3
             self.nb_elite = 1
@@ -511,11 +1805,28 @@ class TSP_GA:
             self.frequence_affichage = 1
             self.activer_2opt = False
 
+    def _creer_route(self, ordre):
+        """Crée une Route dans la représentation choisie (liste ou tableau int32)."""
+        route = Route(self.graph, ordre)
+        if self.mode_tableau:
+            route.vers_tableau()
+        return route
+
+    def _route_aleatoire(self):
+        """Crée une route aléatoire partant et revenant au lieu 0 (longueur non calculée)."""
+        if self.mode_tableau:
+            ordre = np.zeros(self.nb_lieux + 1, dtype=np.int32)
+            ordre[1:-1] = np.random.permutation(np.arange(1, self.nb_lieux, dtype=np.int32))
+            return Route(self.graph, ordre)
+        lieux = list(range(1, self.nb_lieux))
+        random.shuffle(lieux)
+        return Route(self.graph, [0] + lieux + [0])
+
     def optimisation_2opt_ultra_light(self, route, pour_enfant=False):
         """
-        Version ULTRA-LÉGÈRE du 2-opt.
-        - Sur enfants : jusqu'à 1000 lieux
-        - Sur heuristique : jusqu'à 5000 lieux
+        Recherche locale 2-opt / Or-opt (moteur RechercheLocale) sur une route.
+        - Sur enfants : jusqu'à limite_2opt_enfant lieux, budget max_mouvements_2opt_enfant
+        - Sur heuristique : jusqu'à LIMITE_2OPT_HEURISTIQUE lieux, budget temps_max_2opt
         """
         if not self.activer_2opt:
             return
@@ -525,96 +1836,107 @@ class TSP_GA:
             return
         
         # Limite selon contexte
-        if pour_enfant and n > 1000:
+        if pour_enfant and n > self.limite_2opt_enfant:
             return
-        if not pour_enfant and n > 5000:
+        if not pour_enfant and n > LIMITE_2OPT_HEURISTIQUE:
             return
         
-        # Paramètres adaptatifs
-        if n <= 100:
-            max_iterations = 1500
-            max_checks = min(3000, n * n)
-        elif n <= 200:
-            max_iterations = 750
-            max_checks = min(30, n)
-        elif n <= 500:
-            max_iterations = 3
-            max_checks = min(20, n // 2)
-        elif n <= 1000:
-            max_iterations = 3
-            max_checks = min(15, n // 3)
-        elif n <= 2000:
-            max_iterations = 3
-            max_checks = min(10, n // 5)
-        else:  # 2000-5000
-            max_iterations = 1
-            max_checks = min(8, n // 10)
-        
-        ordre = route.ordre
-        checks_done = 0
-        
-        for iteration in range(max_iterations):
-            amelioration = False
-            
-            for i in range(0, len(ordre) - 3, max(1, n // 20)):
-                if checks_done >= max_checks:
-                    break
-                    
-                for j in range(i + 2, min(i + 50, len(ordre) - 1)):
-                    checks_done += 1
-                    if checks_done >= max_checks:
-                        break
-                    
-                    try:
-                        # UTILISER get_distance au lieu de matrice_od direct
-                        dist_avant = (self.graph.get_distance(ordre[i], ordre[i+1]) + 
-                                    self.graph.get_distance(ordre[j], ordre[j+1]))
-                        dist_apres = (self.graph.get_distance(ordre[i], ordre[j]) + 
-                                    self.graph.get_distance(ordre[i+1], ordre[j+1]))
-                        
-                        if dist_apres < dist_avant - 1.0:
-                            route.ordre[i+1:j+1] = reversed(route.ordre[i+1:j+1])
-                            ordre = route.ordre
-                            amelioration = True
-                            route._distance_cache = None
-                    except Exception as e:  
-                        print("ERREUR 2-opt:", e)
-                
-                if checks_done >= max_checks:
-                    break
-            
-            if not amelioration:
-                break
+        if self.recherche_locale is None:
+            self.recherche_locale = RechercheLocale(self.graph)
+        
+        profileur = self.profileur
+        debut = profileur.debut()
+        recherche = self.recherche_locale
+        mouvements, examens = recherche.nb_mouvements, recherche.nb_examens
+        
+        # Le budget de la recherche locale est borné par le temps restant avant l'échéance
+        restant = self.temps_restant()
+        if pour_enfant:
+            temps_max = self.temps_max_2opt_enfant
+            if restant is not None:
+                temps_max = restant if temps_max is None else min(temps_max, restant)
+            gain = recherche.optimiser(route, temps_max=temps_max,
+                                       max_mouvements=self.max_mouvements_2opt_enfant)
+        else:
+            temps_max = self.temps_max_2opt
+            if restant is not None:
+                temps_max = min(temps_max, restant * self.part_temps_2opt)
+            gain = recherche.optimiser(route, temps_max=temps_max)
+        
+        profileur.fin("2opt_enfant" if pour_enfant else "2opt_initial", debut)
+        profileur.compter("gain_2opt", gain)
+        profileur.compter("mouvements_2opt", recherche.nb_mouvements - mouvements)
+        profileur.compter("examens_2opt", recherche.nb_examens - examens)
         
         if route._distance_cache is None:
             route._distance_cache = route.calcul_distance_route()
 
+    def definir_budget(self, temps_max):
+        """
+        Fixe l'échéance de la résolution à temps_max secondes à partir de maintenant.
+        Le 2-opt initial en reçoit au plus part_temps_2opt, les générations le reste.
+
+        Args:
+            temps_max (float): Budget total en secondes (None = pas d'échéance)
+        """
+        self.echeance = None if temps_max is None else time.time() + temps_max
+
+    def temps_restant(self):
+        """Secondes restantes avant l'échéance (None sans échéance)."""
+        if self.echeance is None:
+            return None
+        return max(0.0, self.echeance - time.time())
+
+    def _raison_arret(self, iteration):
+        """Critère d'arrêt atteint avant la génération iteration, ou None pour continuer."""
+        if not self.en_cours:
+            return "interruption"
+        if self.distance_cible is not None and self.meilleure_distance <= self.distance_cible:
+            return "cible"
+        if self.max_stagnation is not None and iteration - 1 - self.iteration_meilleure >= self.max_stagnation:
+            return "stagnation"
+        restant = self.temps_restant()
+        if restant is not None and restant <= self.duree_generation:
+            # La prochaine génération dépasserait l'échéance : on rend la meilleure route
+            return "temps"
+        return None
+
     def initialiser_avec_heuristique(self):
         """
         Initialisation SIMPLIFIÉE.
-        2-opt UNIQUEMENT sur route heuristique et UNIQUEMENT si < 5000 lieux.
+        2-opt UNIQUEMENT sur la route heuristique, jusqu'à LIMITE_2OPT_HEURISTIQUE lieux,
+        dans la limite de temps_max_2opt (et de part_temps_2opt du temps restant si échéance).
         """
-        from __main__ import Route
-        
         print(f"\n=== Initialisation pour {self.nb_lieux} lieux ===")
         temps_debut = time.time()
+        route_heuristique = self._construire_route_heuristique()
+        
+        # ===== POPULATION INITIALE (SANS 2-OPT) =====
+        self.population = [route_heuristique]
         
-        # ===== HEURISTIQUE DU PLUS PROCHE VOISIN =====
-        route_heuristique = Route(self.graph)
-        ordre = [0]
-        lieux_non_visites = set(range(1, self.nb_lieux))
-        lieu_actuel = 0
+        for i in range(self.taille_population - 1):
+            self.population.append(self._route_aleatoire())
+        Route.evaluer_population(self.population)
+        self.index_population.vider()
+        for route in self.population:
+            self.index_population.ajouter(route)
         
-        while lieux_non_visites:
-            prochain = self.graph.plus_proche_voisin(lieu_actuel, lieux_non_visites)
-            if prochain is None:
-                break
-            ordre.append(prochain)
-            lieux_non_visites.remove(prochain)
-            lieu_actuel = prochain
+        # Tri
+        self.population.sort(key=lambda r: r._distance_cache)
+        self.meilleure_route = self.population[0]
+        self.meilleure_distance = self.meilleure_route._distance_cache
+        
+        temps_total = time.time() - temps_debut
+        print(f"Population créée: meilleure = {self.meilleure_distance:.2f} en {temps_total:.2f}s")
+        print("=" * 50)
+
+    def _construire_route_heuristique(self):
+        """Route du plus proche voisin, améliorée par 2-opt si activé (observateurs notifiés)."""
+        temps_debut = time.time()
         
-        ordre.append(0)
-        route_heuristique.ordre = ordre
+        # ===== HEURISTIQUE DU PLUS PROCHE VOISIN (GRILLE SPATIALE) =====
+        ordre = self.graph.tour_plus_proche_voisin(0)
+        route_heuristique = self._creer_route(ordre)
         route_heuristique._distance_cache = route_heuristique.calcul_distance_route()
         
         distance_avant = route_heuristique._distance_cache
@@ -635,172 +1957,330 @@ class TSP_GA:
             distance_apres = distance_avant
         
         # ===== AFFICHAGE =====
-        try:
-            self.affichage.afficher_meilleure_route(route_heuristique)
-            self.affichage.ajouter_texte(f"Route heuristique: {distance_avant:.2f}\n")
-            if self.nb_lieux <= 5000:
-                self.affichage.ajouter_texte(f"Après 2-opt: {distance_apres:.2f}\n")
-        except:
-            pass
-        
-        # ===== POPULATION INITIALE (SANS 2-OPT) =====
-        self.population = [route_heuristique]
-        
-        for i in range(self.taille_population - 1):
-            route = Route(self.graph)
-            lieux = list(range(1, self.nb_lieux))
-            random.shuffle(lieux)
-            route.ordre = [0] + lieux + [0]
-            route._distance_cache = route.calcul_distance_route()
-            self.population.append(route)
-        
-        # Tri
-        self.population.sort(key=lambda r: r._distance_cache)
-        self.meilleure_route = self.population[0]
-        self.meilleure_distance = self.meilleure_route._distance_cache
-        
-        temps_total = time.time() - temps_debut
-        print(f"Population créée: meilleure = {self.meilleure_distance:.2f} en {temps_total:.2f}s")
-        print("=" * 50)
+        self._notifier("initialisation", route_heuristique, distance_avant, distance_apres)
+        return route_heuristique
+
+    def _notifier(self, evenement, *args):
+        """Transmet un événement de progression à tous les observateurs."""
+        for observateur in self.observateurs:
+            debut = self.profileur.debut()
+            try:
+                getattr(observateur, evenement)(self, *args)
+                self.profileur.fin(f"observateur.{type(observateur).__name__}", debut)
+            except Exception as e:
+                print(f"ERREUR observateur {type(observateur).__name__}.{evenement}: {e}")
 
-    def _actualiser_affichage_safe(self):
-        """Mise à jour thread-safe de l'affichage."""
-        try:
-            def update():
-                routes_uniques = []
-                distances_vues = set()
-                for route in self.population[:20]:
-                    if route._distance_cache not in distances_vues:
-                        distances_vues.add(route._distance_cache)
-                        routes_uniques.append(route)
-                    if len(routes_uniques) >= 10:
-                        break
-                
-                if len(routes_uniques) > 1:
-                    self.affichage.afficher_routes_secondaires(routes_uniques[1:])
-                self.affichage.afficher_meilleure_route(self.meilleure_route)
-            
-            self.affichage.root.after(0, update)
-        except:
-            pass
-    
     def selection_tournoi(self, taille_tournoi=3):
         """Sélection par tournoi."""
         taille_tournoi = min(taille_tournoi, max(2, len(self.population) // 2))
         candidats = random.sample(self.population, taille_tournoi)
         return min(candidats, key=lambda r: r._distance_cache)
     
+    def _masque_villes_utilisees(self):
+        """Masque booléen (n,) remis à zéro, alloué une seule fois par instance."""
+        if self._villes_utilisees is None or len(self._villes_utilisees) != self.nb_lieux:
+            self._villes_utilisees = np.zeros(self.nb_lieux, dtype=bool)
+        else:
+            self._villes_utilisees.fill(False)
+        return self._villes_utilisees
+
+    def _route_depuis_tableau(self, ordre):
+        """Route (liste ou tableau selon mode_tableau) depuis un ordre fermé int32, longueur calculée."""
+        enfant = Route(self.graph, ordre if self.mode_tableau else ordre.tolist())
+        enfant._distance_cache = enfant.calcul_distance_route()
+        return enfant
+
     def crossover_ox(self, parent1, parent2):
-        """Crossover OX (Order Crossover)."""
-        from __main__ import Route
-        
-        ordre1 = parent1.ordre[1:-1]
-        ordre2 = parent2.ordre[1:-1]
+        """
+        Crossover OX (Order Crossover) sur tableaux d'entiers : le segment du parent 1
+        est marqué dans un masque booléen, puis les villes restantes du parent 2
+        (lues à partir de point2) complètent l'enfant, écrit directement dans son tableau.
+        """
+        ordre1 = np.asarray(parent1.ordre, dtype=np.int32)[1:-1]
+        ordre2 = np.asarray(parent2.ordre, dtype=np.int32)[1:-1]
         taille = len(ordre1)
         
         if taille < 2:
-            enfant = Route(self.graph)
-            enfant.ordre = parent1.ordre.copy()
+            enfant = Route(self.graph, parent1.ordre.copy())
             enfant._distance_cache = parent1._distance_cache
             return enfant
         
         point1 = random.randint(0, taille - 1)
         point2 = random.randint(point1 + 1, taille)
         
-        enfant_ordre = [None] * taille
-        enfant_ordre[point1:point2] = ordre1[point1:point2]
+        villes_utilisees = self._masque_villes_utilisees()
+        villes_utilisees[ordre1[point1:point2]] = True
         
-        villes_utilisees = set(enfant_ordre[point1:point2])
-        position = point2
+        # Parent 2 lu à partir de point2 (circulairement), sans les villes du segment
+        rotation = np.concatenate((ordre2[point2:], ordre2[:point2]))
+        restantes = rotation[~villes_utilisees[rotation]]
         
-        for ville in ordre2[point2:] + ordre2[:point2]:
-            if ville not in villes_utilisees:
-                enfant_ordre[position % taille] = ville
-                villes_utilisees.add(ville)
-                position += 1
-        
-        enfant = Route(self.graph)
-        enfant.ordre = [0] + enfant_ordre + [0]
-        enfant._distance_cache = enfant.calcul_distance_route()
-        return enfant
+        enfant_ordre = np.zeros(taille + 2, dtype=np.int32)
+        interieur = enfant_ordre[1:-1]
+        interieur[point1:point2] = ordre1[point1:point2]
+        nb_fin = taille - point2
+        interieur[point2:] = restantes[:nb_fin]
+        interieur[:point1] = restantes[nb_fin:]
+        return self._route_depuis_tableau(enfant_ordre)
+
+    def crossover_erx(self, parent1, parent2):
+        """
+        Recombinaison d'arêtes (edge recombination, variante gloutonne).
+        Depuis le lieu 0, l'enfant suit en priorité une arête commune aux deux parents,
+        sinon la plus courte arête parentale vers une ville libre, sinon le plus proche
+        voisin candidat libre, et en dernier recours une ville libre au hasard.
+        Les bonnes arêtes des parents sont ainsi conservées.
+        """
+        n = self.nb_lieux
+        if n < 4:
+            return self.crossover_ox(parent1, parent2)
+        
+        # Voisins de chaque ville dans les deux parents : [préc1, suiv1, préc2, suiv2]
+        voisins = np.empty((n, 4), dtype=np.intp)
+        for colonne, parent in ((0, parent1), (2, parent2)):
+            cycle = np.asarray(parent.ordre, dtype=np.intp)[:-1]
+            voisins[cycle, colonne] = np.roll(cycle, 1)
+            voisins[cycle, colonne + 1] = np.roll(cycle, -1)
+        voisins = voisins.tolist()
+        
+        candidats = self.graph.voisins_candidats
+        candidats = candidats.tolist() if candidats is not None else None
+        d = self.graph.get_distance
+        
+        # Villes libres : liste avec positions pour un retrait et un tirage en O(1)
+        libres = list(range(n))
+        position = list(range(n))
+        utilisee = [False] * n
+        
+        def retirer(ville):
+            utilisee[ville] = True
+            i = position[ville]
+            derniere = libres.pop()
+            if derniere != ville:
+                libres[i] = derniere
+                position[derniere] = i
+        
+        enfant_ordre = np.zeros(n + 1, dtype=np.int32)
+        courante = 0
+        retirer(0)
+        for k in range(1, n):
+            p1, s1, p2, s2 = voisins[courante]
+            choix = -1
+            # 1) Arête présente dans les deux parents
+            for v in (p1, s1):
+                if not utilisee[v] and (v == p2 or v == s2):
+                    choix = v
+                    break
+            # 2) Plus courte arête parentale disponible
+            if choix < 0:
+                meilleure = float('inf')
+                for v in (p1, s1, p2, s2):
+                    if not utilisee[v]:
+                        dv = d(courante, v)
+                        if dv < meilleure:
+                            meilleure, choix = dv, v
+            # 3) Plus proche voisin candidat libre, 4) ville libre au hasard
+            if choix < 0 and candidats is not None:
+                for v in candidats[courante]:
+                    if not utilisee[v]:
+                        choix = v
+                        break
+            if choix < 0:
+                choix = libres[random.randrange(len(libres))]
+            enfant_ordre[k] = choix
+            retirer(choix)
+            courante = choix
+        return self._route_depuis_tableau(enfant_ordre)
+
+    def croiser(self, parent1, parent2):
+        """Applique l'opérateur de crossover choisi par self.type_crossover."""
+        operateurs = {
+            "ox": self.crossover_ox,
+            "erx": self.crossover_erx,
+        }
+        return operateurs[self.type_crossover](parent1, parent2)
     
     def mutation_swap(self, route):
-        """Mutation par échange de 2 lieux."""
+        """Mutation par échange de 2 lieux (en place, longueur mise à jour en O(1))."""
         if random.random() < self.taux_mutation:
-            ordre = route.ordre[1:-1]
-            if len(ordre) > 1:
-                i, j = random.sample(range(len(ordre)), 2)
+            ordre = route.ordre
+            if len(ordre) > 3:
+                i, j = sorted(random.sample(range(1, len(ordre) - 1), 2))
+                if route._empreinte is not None:
+                    a, b = ordre[i], ordre[j]
+                    if j == i + 1:
+                        retirees = [(ordre[i - 1], a), (b, ordre[j + 1])]
+                        ajoutees = [(ordre[i - 1], b), (a, ordre[j + 1])]
+                    else:
+                        retirees = [(ordre[i - 1], a), (a, ordre[i + 1]), (ordre[j - 1], b), (b, ordre[j + 1])]
+                        ajoutees = [(ordre[i - 1], b), (b, ordre[i + 1]), (ordre[j - 1], a), (a, ordre[j + 1])]
+                    self.index_population.remplacer_aretes(route, retirees, ajoutees)
+                if route._distance_cache is not None:
+                    d = self.graph.get_distance
+                    a, b = ordre[i], ordre[j]
+                    if j == i + 1:
+                        delta = (d(ordre[i - 1], b) + d(a, ordre[j + 1])
+                                 - d(ordre[i - 1], a) - d(b, ordre[j + 1]))
+                    else:
+                        delta = (d(ordre[i - 1], b) + d(b, ordre[i + 1])
+                                 + d(ordre[j - 1], a) + d(a, ordre[j + 1])
+                                 - d(ordre[i - 1], a) - d(a, ordre[i + 1])
+                                 - d(ordre[j - 1], b) - d(b, ordre[j + 1]))
+                    route._distance_cache += delta
                 ordre[i], ordre[j] = ordre[j], ordre[i]
-                route.ordre = [0] + ordre + [0]
-                route._distance_cache = None
+
+    def mutation_inversion(self, route):
+        """Mutation par inversion d'un segment (2 arêtes modifiées, delta en O(1))."""
+        if random.random() < self.taux_mutation:
+            ordre = route.ordre
+            if len(ordre) > 3:
+                i, j = sorted(random.sample(range(1, len(ordre) - 1), 2))
+                self.index_population.remplacer_aretes(
+                    route, [(ordre[i - 1], ordre[i]), (ordre[j], ordre[j + 1])],
+                    [(ordre[i - 1], ordre[j]), (ordre[i], ordre[j + 1])])
+                if route._distance_cache is not None:
+                    d = self.graph.get_distance
+                    route._distance_cache += (d(ordre[i - 1], ordre[j]) + d(ordre[i], ordre[j + 1])
+                                              - d(ordre[i - 1], ordre[i]) - d(ordre[j], ordre[j + 1]))
+                ordre[i:j + 1] = ordre[i:j + 1][::-1]
+
+    def mutation_insertion(self, route):
+        """Mutation par déplacement d'un lieu à une autre position (delta en O(1))."""
+        if random.random() < self.taux_mutation:
+            ordre = route.ordre
+            if len(ordre) > 3:
+                i, j = random.sample(range(1, len(ordre) - 1), 2)
+                v = ordre[i]
+                # Arête (x, y) où le lieu v vient s'insérer
+                x, y = (ordre[j], ordre[j + 1]) if i < j else (ordre[j - 1], ordre[j])
+                self.index_population.remplacer_aretes(
+                    route, [(ordre[i - 1], v), (v, ordre[i + 1]), (x, y)],
+                    [(ordre[i - 1], ordre[i + 1]), (x, v), (v, y)])
+                if route._distance_cache is not None:
+                    d = self.graph.get_distance
+                    route._distance_cache += (d(ordre[i - 1], ordre[i + 1])
+                                              - d(ordre[i - 1], v) - d(v, ordre[i + 1])
+                                              + d(x, v) + d(v, y) - d(x, y))
+                # Décalage en place du bloc entre i et j
+                if i < j:
+                    ordre[i:j] = ordre[i + 1:j + 1]
+                else:
+                    ordre[j + 1:i + 1] = ordre[j:i]
+                ordre[j] = v
+
+    def muter(self, route):
+        """Applique l'opérateur de mutation choisi par self.type_mutation."""
+        operateurs = {
+            "swap": self.mutation_swap,
+            "inversion": self.mutation_inversion,
+            "insertion": self.mutation_insertion,
+        }
+        operateurs[self.type_mutation](route)
     
-    def nouvelle_generation(self):
-        """Génère une nouvelle population (SANS 2-opt sur enfants)."""
-        from __main__ import Route
+    def _proba_2opt_enfant(self):
+        """
+        Probabilité d'appliquer le 2-opt à un enfant (décroissante selon la taille).
+        Dans les processus du pool (limite_2opt_enfant relevée), chaque enfant est optimisé.
+        """
+        if self.nb_lieux > self.limite_2opt_enfant:
+            return 0.0
+        if self.limite_2opt_enfant > LIMITE_2OPT_ENFANT:
+            return 1.0
+        if self.nb_lieux <= 100:
+            return 0.9
+        elif self.nb_lieux <= 200:
+            return 0.7
+        elif self.nb_lieux <= 500:
+            return 0.4
+        elif self.nb_lieux <= 1000:
+            return 0.05
+        return 0.0
+
+    def _produire_enfant(self, parent1, parent2):
+        """Crossover (ou copie), mutation et 2-opt éventuel d'un enfant."""
+        profileur = self.profileur
+        debut = profileur.debut()
+        if random.random() < self.taux_crossover:
+            enfant = self.croiser(parent1, parent2)
+            profileur.fin(f"crossover_{self.type_crossover}", debut)
+        else:
+            enfant = Route(self.graph, parent1.ordre.copy())
+            enfant._distance_cache = parent1._distance_cache
+            enfant._empreinte = parent1._empreinte
+            profileur.fin("copie", debut)
+        
+        # Mutation
+        debut = profileur.debut()
+        self.muter(enfant)
+        profileur.fin(f"mutation_{self.type_mutation}", debut)
         
+        # ===== 2-OPT SUR ENFANTS (JUSQU'À limite_2opt_enfant LIEUX) =====
+        if random.random() < self._proba_2opt_enfant():
+            self.optimisation_2opt_ultra_light(enfant, pour_enfant=True)
+        
+        if enfant._distance_cache is None:
+            enfant._distance_cache = enfant.calcul_distance_route()
+        return enfant
+
+    def _ajouter_si_nouveau(self, nouvelle_population, enfant):
+        """Ajoute l'enfant s'il n'est pas un doublon de la nouvelle population (index en O(1))."""
+        debut = self.profileur.debut()
+        if self.index_population.ajouter(enfant):
+            nouvelle_population.append(enfant)
+        else:
+            self.profileur.compter("doublons_rejetes")
+        self.profileur.fin("doublons", debut)
+
+    def nouvelle_generation(self):
+        """Génère une nouvelle population (en série ou sur le pool de processus)."""
         nouvelle_population = []
+        self.index_population.vider()
         
         # Élitisme
         for i in range(self.nb_elite):
-            nouvelle_population.append(self.population[i])
+            self._ajouter_si_nouveau(nouvelle_population, self.population[i])
         
         # Génération d'enfants
         tentatives = 0
         max_tentatives = self.taille_population * 3
         
         while len(nouvelle_population) < self.taille_population and tentatives < max_tentatives:
-            tentatives += 1
+            if self.pool is not None:
+                nb_manquants = min(self.taille_population - len(nouvelle_population),
+                                   max_tentatives - tentatives)
+                tentatives += nb_manquants
+                debut = self.profileur.debut()
+                enfants, _ = self._produire_enfants_parallele(nb_manquants)
+                self.profileur.fin("parallele", debut)
+                self.profileur.compter("enfants", len(enfants))
+                for enfant in enfants:
+                    self._ajouter_si_nouveau(nouvelle_population, enfant)
+                continue
             
+            tentatives += 1
             try:
+                debut = self.profileur.debut()
                 parent1 = self.selection_tournoi()
                 parent2 = self.selection_tournoi()
-                
-                if random.random() < self.taux_crossover:
-                    enfant = self.crossover_ox(parent1, parent2)
-                else:
-                    enfant = Route(self.graph)
-                    enfant.ordre = parent1.ordre.copy()
-                    enfant._distance_cache = parent1._distance_cache
-                
-                # Mutation
-                self.mutation_swap(enfant)
-                
-                # ===== 2-OPT SUR ENFANTS (JUSQU'À 1000 LIEUX) =====
-                if self.nb_lieux <= 1000:
-                    # Probabilité décroissante selon taille
-                    if self.nb_lieux <= 100:
-                        proba_2opt = 0.9  # 50% pour petits graphes
-                    elif self.nb_lieux <= 200:
-                        proba_2opt = 0.7
-                    elif self.nb_lieux <= 500:
-                        proba_2opt = 0.4
-                    else:  # 500-1000
-                        proba_2opt = 0.05
-                    
-                    if random.random() < proba_2opt:
-                        self.optimisation_2opt_ultra_light(enfant, pour_enfant=True)
-                
-                if enfant._distance_cache is None:
-                    enfant._distance_cache = enfant.calcul_distance_route()
-                
-                # Éviter doublons
-                est_doublon = any(abs(r._distance_cache - enfant._distance_cache) < 0.01 
-                                for r in nouvelle_population)
-                if not est_doublon:
-                    nouvelle_population.append(enfant)
-            except:
-                pass
+                self.profileur.fin("selection", debut)
+                enfant = self._produire_enfant(parent1, parent2)
+                self.profileur.compter("enfants")
+                self._ajouter_si_nouveau(nouvelle_population, enfant)
+            except Exception as e:
+                print(f"ERREUR production d'un enfant: {type(e).__name__}: {e}")
         
         while len(nouvelle_population) < self.taille_population:
-            route = Route(self.graph)
-            lieux = list(range(1, self.nb_lieux))
-            random.shuffle(lieux)
-            route.ordre = [0] + lieux + [0]
-            route._distance_cache = route.calcul_distance_route()
+            route = self._route_aleatoire()
+            self.index_population.ajouter(route)
             nouvelle_population.append(route)
+        debut = self.profileur.debut()
+        Route.evaluer_population(nouvelle_population)
+        self.profileur.fin("evaluation", debut)
         
+        debut = self.profileur.debut()
         self.population = nouvelle_population
         self.population.sort(key=lambda r: r._distance_cache)
+        self.profileur.fin("tri", debut)
         
         # Mise à jour meilleure route
         distance_actuelle = self.population[0]._distance_cache
@@ -811,54 +2291,1560 @@ class TSP_GA:
             return True
         return False
     
-    def executer_thread(self):
-        """Exécution de l'algorithme dans un thread."""
-        import time
-        
-        temps_debut = time.time()
-        self.affichage.ajouter_texte(f"Algorithme génétique: {self.nb_iterations_max} itérations\n\n")
+    def meilleurs_individus(self, nb):
+        """Renvoie les ordres (tableaux int32) et longueurs des nb meilleures routes."""
+        return [(np.asarray(r.ordre, dtype=np.int32), r._distance_cache)
+                for r in self.population[:nb]]
+
+    def integrer_migrants(self, migrants):
+        """
+        Remplace les pires individus par des migrants venus d'une autre île.
         
-        for iteration in range(1, self.nb_iterations_max + 1):
-            if not self.en_cours:
-                break
-            
-            self.iteration_courante = iteration
-            amelioration = self.nouvelle_generation()
+        Args:
+            migrants (list): Liste de (ordre, longueur)
             
-            # Affichage
-            if iteration % self.frequence_affichage == 0 or amelioration or iteration == self.nb_iterations_max:
-                self._actualiser_affichage_safe()
-                
-                if amelioration:
-                    info = (f"Iter {iteration:3d}/{self.nb_iterations_max} | "
-                           f"Best: {self.meilleure_distance:7.2f} | "
-                           f"Found: iter {self.iteration_meilleure:3d}")
-                    self.affichage.root.after(0, lambda i=info: self.affichage.ajouter_texte(i + "\n"))
-        
-        # Affichage final
-        temps_total = time.time() - temps_debut
-        
-        def affichage_final():
-            self.affichage.ajouter_texte(f"\n=== RÉSULTAT FINAL ===\n")
-            self.affichage.ajouter_texte(f"Meilleure distance: {self.meilleure_distance:.2f}\n")
-            self.affichage.ajouter_texte(f"Trouvée: itération {self.iteration_meilleure}\n")
+        Returns:
+            bool: True si un migrant améliore la meilleure route
+        """
+        for ordre, distance in migrants:
+            migrant = self._creer_route(ordre if self.mode_tableau else ordre.tolist())
+            migrant._distance_cache = distance
+            if distance < self.population[-1]._distance_cache and self.index_population.ajouter(migrant):
+                self.index_population.retirer(self.population[-1])
+                self.population[-1] = migrant
+                self.population.sort(key=lambda r: r._distance_cache)
+        
+        if self.population[0]._distance_cache < self.meilleure_distance:
+            self.meilleure_route = self.population[0]
+            self.meilleure_distance = self.population[0]._distance_cache
+            self.iteration_meilleure = self.iteration_courante
+            return True
+        return False
+
+    def activer_parallele(self, nb_processus=None, verifier_gain=True):
+        """
+        Active la génération parallèle des enfants sur un pool de processus.
+        Coordonnées, matrice et voisins candidats sont placés une seule fois
+        en mémoire partagée ; seuls les parents et les enfants transitent.
+        
+        Chaque génération paie un aller-retour fixe vers le pool (sérialisation des
+        parents et des enfants), que crossover et mutation seuls (quelques centaines
+        de µs) ne rentabilisent pas. Les processus du pool appliquent donc le 2-opt
+        à chaque enfant, jusqu'à LIMITE_2OPT_ENFANT_PARALLELE lieux (budget
+        max_mouvements_2opt_enfant) : de quelques ms à quelques centaines de ms par enfant.
+        Si la population est déjà créée, le gain est mesuré (voir _parallele_rentable)
+        et le pool refermé s'il ne fait pas gagner au moins 20 % sur le même travail en série.
         
-        self.affichage.root.after(0, affichage_final)
-        self.en_cours = False
-    
-    def lancer(self):
-        """Lance l'algorithme dans un thread."""
-        self.en_cours = True
-        thread = threading.Thread(target=self.executer_thread, daemon=False)
-        thread.start()
+        Args:
+            nb_processus (int): Nombre de processus (par défaut : nombre de cœurs)
+            verifier_gain (bool): Mesurer le gain et rester en série s'il est nul
+            
+        Returns:
+            bool: True si la génération parallèle est active
+        """
+        self.fermer_parallele()
+        nb_processus = nb_processus or os.cpu_count() or 1
+        if self.activer_2opt and self.nb_lieux <= LIMITE_2OPT_ENFANT_PARALLELE:
+            self.graph.calcul_voisins_candidats()
+        self.memoire_partagee = MemoirePartagee(self.graph)
+        parametres = {
+            "taux_crossover": self.taux_crossover,
+            "taux_mutation": self.taux_mutation,
+            "type_mutation": self.type_mutation,
+            "type_crossover": self.type_crossover,
+            "activer_2opt": self.activer_2opt,
+            "temps_max_2opt_enfant": self.temps_max_2opt_enfant,
+            "max_mouvements_2opt_enfant": self.max_mouvements_2opt_enfant,
+            "limite_2opt_enfant": LIMITE_2OPT_ENFANT_PARALLELE,
+        }
+        contexte = multiprocessing.get_context("spawn")
+        self.pool = contexte.Pool(nb_processus, initializer=_initialiser_worker,
+                                  initargs=(self.memoire_partagee.descripteur, parametres))
+        self.nb_processus = nb_processus
+        
+        if verifier_gain and self.population:
+            temps_serie, temps_parallele = self._parallele_rentable()
+            if temps_parallele > 0.8 * temps_serie:  # Gain exigé : au moins 20 %, au-delà du bruit de mesure
+                print(f"Génération parallèle désactivée : {temps_parallele * 1000:.1f} ms par génération "
+                      f"sur le pool contre {temps_serie * 1000:.1f} ms en série")
+                self.fermer_parallele()
+                self.nb_processus = 1
+                return False
+        return True
+
+    def _parallele_rentable(self, nb_essais=2):
+        """
+        Mesure la production d'une génération d'enfants sur le pool (après un lot de
+        chauffe par processus). Le temps en série est estimé par le temps CPU cumulé
+        des processus : c'est le même travail, sans l'aller-retour. Les enfants sont
+        jetés et l'état des générateurs aléatoires restauré, de sorte que la mesure
+        ne change pas la suite de la résolution.
+        
+        Returns:
+            tuple: (temps estimé en série, meilleur temps sur le pool) en secondes
+        """
+        etat_random, etat_numpy = random.getstate(), np.random.get_state()
+        try:
+            nb_enfants = max(1, self.taille_population - self.nb_elite)
+            self._produire_enfants_parallele(self.nb_processus)
+            temps_serie = temps_parallele = float('inf')
+            for _ in range(nb_essais):
+                debut = time.perf_counter()
+                _, temps_calcul = self._produire_enfants_parallele(nb_enfants)
+                temps_parallele = min(temps_parallele, time.perf_counter() - debut)
+                temps_serie = min(temps_serie, temps_calcul)
+            return temps_serie, temps_parallele
+        finally:
+            random.setstate(etat_random)
+            np.random.set_state(etat_numpy)
+
+    def fermer_parallele(self):
+        """Arrête le pool de processus et libère la mémoire partagée."""
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+        if self.memoire_partagee is not None:
+            self.memoire_partagee.fermer()
+            self.memoire_partagee = None
+
+    def _produire_enfants_parallele(self, nb_enfants):
+        """
+        Sélectionne les parents ici, puis répartit crossover, mutation et 2-opt
+        par lots sur les processus du pool.
+        
+        Returns:
+            tuple: (enfants, temps CPU cumulé des processus en secondes)
+        """
+        paires = [(self.selection_tournoi(), self.selection_tournoi()) for _ in range(nb_enfants)]
+        taille_lot = max(1, math.ceil(nb_enfants / self.nb_processus))
+        lots = []
+        for debut in range(0, nb_enfants, taille_lot):
+            lot = [(np.asarray(p1.ordre, dtype=np.int32), p1._distance_cache,
+                    np.asarray(p2.ordre, dtype=np.int32), p2._distance_cache)
+                   for p1, p2 in paires[debut:debut + taille_lot]]
+            lots.append((lot, random.getrandbits(32)))
+        
+        enfants = []
+        temps_calcul = 0.0
+        for resultats, temps_lot in self.pool.map(_produire_lot_enfants, lots):
+            temps_calcul += temps_lot
+            for ordre, distance in resultats:
+                enfant = self._creer_route(ordre if self.mode_tableau else ordre.tolist())
+                enfant._distance_cache = distance
+                enfants.append(enfant)
+        return enfants, temps_calcul
+
+    def executer(self, nb_iterations=None, temps_max=None, max_stagnation=None, distance_cible=None):
+        """
+        Exécute l'algorithme génétique de façon bloquante, sans dépendance à l'affichage.
+        S'arrête au premier critère atteint : nombre de générations, échéance,
+        stagnation ou longueur cible ; la meilleure route trouvée est toujours rendue.
+
+        Args:
+            nb_iterations (int): Nombre de générations (défaut : nb_iterations_max)
+            temps_max (float): Budget de temps des générations en secondes (None = illimité) ;
+                l'échéance fixée par definir_budget est conservée si elle est plus proche
+            max_stagnation (int): Générations sans amélioration avant arrêt
+            distance_cible (float): Longueur suffisante pour s'arrêter
+
+        Returns:
+            dict: Statistiques de l'exécution (voir statistiques)
+        """
+        if self.resolution_exacte():
+            return self._executer_exact()
+        depart, self.iteration_depart = self.iteration_depart, 1
+        if depart > 1:
+            nb_iterations = nb_iterations or self.nb_iterations_execution  # Objectif de l'exécution reprise
+        nb_iterations = nb_iterations or self.nb_iterations_max
+        self.nb_iterations_execution = nb_iterations
+        if max_stagnation is not None:
+            self.max_stagnation = max_stagnation
+        if distance_cible is not None:
+            self.distance_cible = distance_cible
+        self.en_cours = True
+        temps_debut = time.time()
+        self._derniere_reprise = temps_debut
+        if temps_max is not None:
+            echeance = temps_debut + temps_max
+            self.echeance = echeance if self.echeance is None else min(self.echeance, echeance)
+        self.raison_arret = "iterations"
+        self._notifier("debut", nb_iterations)
+
+        for iteration in range(depart, nb_iterations + 1):
+            raison = self._raison_arret(iteration)
+            if raison is not None:
+                self.raison_arret = raison
+                break
+
+            temps_generation = time.time()
+            self.iteration_courante = iteration
+            amelioration = self.nouvelle_generation()
+            duree = time.time() - temps_generation
+            self.duree_generation = duree if iteration == depart else 0.8 * self.duree_generation + 0.2 * duree
+            self._notifier("iteration", iteration, amelioration)
+            if self.chemin_reprise is not None and time.time() - self._derniere_reprise >= self.intervalle_reprise:
+                self.sauvegarder_point_reprise()
+
+        if self.chemin_reprise is not None and self.iteration_courante >= depart:
+            self.sauvegarder_point_reprise()
+        temps_total = time.time() - temps_debut
+        self.en_cours = False
+        self.fermer_parallele()
+        self._notifier("fin", temps_total)
+        return self.statistiques(temps_total)
+
+    def resolution_exacte(self):
+        """Vrai si l'instance est assez petite pour Held-Karp (le GA est alors inutile)."""
+        return self.nb_lieux <= self.seuil_exact
+
+    def _executer_exact(self):
+        """Résout par Held-Karp et installe la route optimale (mêmes notifications que le GA)."""
+        self.en_cours = True
+        temps_debut = time.time()
+        self._notifier("debut", 1)
+        ordre, distance = held_karp(self.graph)
+        route = self._creer_route(ordre)
+        route._distance_cache = distance
+        if isinstance(self.population, list):
+            self.population.insert(0, route)
+            self.index_population.ajouter(route)
+        self.meilleure_route = route
+        self.meilleure_distance = distance
+        self.iteration_courante = 1
+        self.iteration_meilleure = 1
+        self.raison_arret = "optimal"
+        self._notifier("iteration", 1, True)
+        
+        temps_total = time.time() - temps_debut
+        self.en_cours = False
+        self.fermer_parallele()
+        self._notifier("fin", temps_total)
+        return self.statistiques(temps_total)
+
+    # ----- Points de reprise -----
+
+    def activer_points_reprise(self, chemin, intervalle=30.0):
+        """
+        Écrit périodiquement l'état de la résolution pendant executer() (et à la fin).
+
+        Args:
+            chemin (str): Fichier du point de reprise (remplacé à chaque écriture)
+            intervalle (float): Secondes minimales entre deux écritures (0 = chaque génération)
+        """
+        self.chemin_reprise = chemin
+        self.intervalle_reprise = intervalle
+
+    def _tours_population(self):
+        """Cycles (P, n) int32 commençant en 0 et longueurs (P,) de la population."""
+        tours = np.array([np.asarray(r.ordre[:-1], dtype=np.int32) for r in self.population],
+                         dtype=np.int32).reshape(len(self.population), self.nb_lieux)
+        distances = np.array([r._distance_cache for r in self.population], dtype=np.float64)
+        return tours, distances
+
+    def _restaurer_population(self, tours, distances):
+        """Recrée la population (et son index) depuis les cycles et longueurs sauvegardés."""
+        self.population = []
+        self.index_population.vider()
+        for tour, distance in zip(tours, distances):
+            route = self._creer_route(self._ordre_ferme(tour))
+            route._distance_cache = float(distance)
+            self.population.append(route)
+            self.index_population.ajouter(route)
+
+    def _ordre_ferme(self, tour):
+        """Ordre fermé [0, ..., 0] (tableau int32 ou liste selon mode_tableau) depuis un cycle."""
+        ordre = np.zeros(len(tour) + 1, dtype=np.int32)
+        ordre[:-1] = tour
+        return ordre if self.mode_tableau else ordre.tolist()
+
+    def _empreinte_instance(self):
+        """Empreinte des coordonnées (calculée une fois), pour refuser une reprise sur une autre instance."""
+        if self._empreinte_graphe is None:
+            self._empreinte_graphe = self.graph.empreinte()
+        return self._empreinte_graphe
+
+    def sauvegarder_point_reprise(self, chemin=None):
+        """
+        Écrit l'état courant en binaire (.npz non compressé) de façon atomique :
+        fichier temporaire puis os.replace, jamais de point de reprise partiel.
+        Contenu : cycles de la population en entiers non signés 16 ou 32 bits,
+        longueurs, meilleure route, états des générateurs random et np.random,
+        paramètres et compteurs (en-tête JSON).
+
+        Args:
+            chemin (str): Fichier de sortie (défaut : chemin_reprise)
+        """
+        import json
+
+        chemin = chemin or self.chemin_reprise
+        debut = self.profileur.debut()
+        type_lieu = np.uint16 if self.nb_lieux <= 1 << 16 else np.uint32
+        tours, distances = self._tours_population()
+        version_random, etat_random, gauss_random = random.getstate()
+        _, cles_numpy, position_numpy, a_gauss_numpy, gauss_numpy = np.random.get_state()
+        entete = {
+            "version": VERSION_POINT_REPRISE,
+            "classe": type(self).__name__,
+            "nb_lieux": self.nb_lieux,
+            "empreinte_graphe": self._empreinte_instance(),
+            "iteration_courante": self.iteration_courante,
+            "iteration_meilleure": self.iteration_meilleure,
+            "meilleure_distance": self.meilleure_distance,
+            "nb_iterations": self.nb_iterations_execution,
+            "parametres": {cle: getattr(self, cle) for cle in PARAMETRES_POINT_REPRISE},
+            "random": [version_random, gauss_random],
+            "numpy": [int(position_numpy), int(a_gauss_numpy), float(gauss_numpy)],
+        }
+        temporaire = f"{chemin}.{os.getpid()}.tmp"
+        with open(temporaire, 'wb') as fichier:
+            np.savez(fichier,
+                     entete=np.frombuffer(json.dumps(entete).encode('utf-8'), dtype=np.uint8),
+                     tours=tours.astype(type_lieu),
+                     distances=distances,
+                     meilleure=np.asarray(self.meilleure_route.ordre[:-1]).astype(type_lieu),
+                     etat_random=np.array(etat_random, dtype=np.uint32),
+                     etat_numpy=np.asarray(cles_numpy, dtype=np.uint32))
+        os.replace(temporaire, chemin)
+        self._derniere_reprise = time.time()
+        self.profileur.fin("point_reprise", debut)
+
+    def reprendre(self, chemin):
+        """
+        Restaure l'état écrit par sauvegarder_point_reprise : le prochain executer()
+        continue à la génération suivante avec les mêmes générateurs aléatoires, et
+        produit les mêmes routes qu'une exécution ininterrompue (génération en série).
+
+        Args:
+            chemin (str): Fichier du point de reprise
+
+        Raises:
+            ValueError: Format inconnu ou point de reprise d'une autre instance
+        """
+        import json
+
+        with np.load(chemin) as donnees:
+            entete = json.loads(donnees["entete"].tobytes().decode('utf-8'))
+            if entete.get("version") != VERSION_POINT_REPRISE:
+                raise ValueError(f"Version de point de reprise non gérée: {entete.get('version')}")
+            if (entete["nb_lieux"] != self.nb_lieux
+                    or entete["empreinte_graphe"] != self._empreinte_instance()):
+                raise ValueError(f"Le point de reprise {chemin} concerne une autre instance")
+            tours = donnees["tours"].astype(np.int32)
+            distances = donnees["distances"]
+            meilleure = donnees["meilleure"].astype(np.int32)
+            etat_random = donnees["etat_random"]
+            etat_numpy = donnees["etat_numpy"]
+
+        for cle, valeur in entete["parametres"].items():
+            setattr(self, cle, valeur)
+        self._restaurer_population(tours, distances)
+        self.meilleure_route = self._creer_route(self._ordre_ferme(meilleure))
+        self.meilleure_route._distance_cache = entete["meilleure_distance"]
+        self.meilleure_distance = entete["meilleure_distance"]
+        self.iteration_courante = entete["iteration_courante"]
+        self.iteration_meilleure = entete["iteration_meilleure"]
+        self.nb_iterations_execution = entete["nb_iterations"]
+        self.iteration_depart = self.iteration_courante + 1
+        
+        version_random, gauss_random = entete["random"]
+        random.setstate((version_random, tuple(int(v) for v in etat_random), gauss_random))
+        position_numpy, a_gauss_numpy, gauss_numpy = entete["numpy"]
+        np.random.set_state(("MT19937", etat_numpy, position_numpy, a_gauss_numpy, gauss_numpy))
+        print(f"Reprise depuis {chemin}: génération {self.iteration_courante}, "
+              f"meilleure = {self.meilleure_distance:.2f}")
+
+    def statistiques(self, temps_total=None):
+        """Résumé de l'exécution : meilleure route et indicateurs."""
+        statistiques = {
+            "ordre": [int(v) for v in self.meilleure_route.ordre] if self.meilleure_route else [],
+            "distance": self.meilleure_distance,
+            "iteration_meilleure": self.iteration_meilleure,
+            "iterations": self.iteration_courante,
+            "taille_population": self.taille_population,
+            "nb_lieux": self.nb_lieux,
+            "temps": temps_total,
+            "raison_arret": self.raison_arret,
+            "diversite": self.diversite(),
+        }
+        if self.profileur.actif:
+            statistiques["profil"] = self.profileur.resume()
+        return statistiques
+
+    def diversite(self):
+        """Indicateurs de diversité de la population courante (voir IndexPopulation.diversite)."""
+        return self.index_population.diversite(self.population)
+
+    def taux_routes_distinctes(self):
+        """Proportion de routes distinctes dans la population (sans recalcul)."""
+        return len(self.index_population) / max(1, len(self.population))
+
+    def executer_thread(self):
+        """Exécution de l'algorithme dans un thread."""
+        self.executer()
+
+    def lancer(self):
+        """Lance l'algorithme dans un thread."""
+        self.en_cours = True
+        thread = threading.Thread(target=self.executer_thread, daemon=False)
+        thread.start()
 
 
 
+# ============================================================================
+# MOTEUR GÉNÉTIQUE VECTORISÉ
+#Variante de TSP_GA où toute la population tient dans une matrice (P, n) int32
+#(chaque ligne est un cycle commençant au lieu 0) et un vecteur (P,) de longueurs.
+#Sélection, crossover OX, mutation, doublons, évaluation et élitisme sont des
+#opérations NumPy sur toute la population : des centaines de routes par génération.
+# ============================================================================
+
+CASES_POPULATION_MAX = 10_000_000  # P * n maximal des matrices de travail du moteur vectorisé
+
+
+class VuePopulation(Sequence):
+    """
+    Population d'un TSP_GA_Vectorise vue comme une séquence de Route triée par longueur.
+    Les Route (ordres fermés) ne sont créées qu'à la lecture (observateurs, affichage).
+    """
+
+    def __init__(self, tsp_ga):
+        self.tsp_ga = tsp_ga
+
+    def __len__(self):
+        return len(self.tsp_ga.tours)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self[i] for i in range(*indice.indices(len(self)))]
+        if indice < 0:
+            indice += len(self)
+        return self.tsp_ga._route_ligne(indice)
+
+
+class TSP_GA_Vectorise(TSP_GA):
+    """
+    Algorithme génétique sur une population stockée en une matrice (P, n) int32.
+    Mêmes critères d'arrêt, observateurs et statistiques que TSP_GA ;
+    seule la meilleure route de chaque génération passe par la recherche locale.
+    """
+
+    def __init__(self, graph, affichage=None, observateurs=None, taille_population=None):
+        self.tours = np.empty((0, len(graph.liste_lieux)), dtype=np.int32)
+        self.longueurs = np.empty(0, dtype=np.float64)
+        self.nb_routes_distinctes = 0
+        super().__init__(graph, affichage, mode_tableau=True, observateurs=observateurs)
+        if taille_population:
+            self.taille_population = taille_population
+            self.nb_elite = max(2, taille_population // 20)
+        self.taille_tournoi = 3
+        self.type_mutation = "inversion"  # "inversion", "swap" ou "insertion"
+        self.population = VuePopulation(self)
+
+    def _configurer_parametres(self):
+        """Paramètres de TSP_GA, avec une population bornée par CASES_POPULATION_MAX."""
+        super()._configurer_parametres()
+        self.taille_population = int(min(1024, max(64, CASES_POPULATION_MAX // max(self.nb_lieux, 1))))
+        self.nb_elite = max(2, self.taille_population // 20)
+        self.taux_mutation = 0.3
+
+    def activer_parallele(self, nb_processus=None):
+        """Sans objet : les opérateurs travaillent déjà sur toute la population à la fois."""
+        print("Moteur vectorisé : génération parallèle non utilisée.")
+
+    def _tours_population(self):
+        return self.tours, self.longueurs
+
+    def _restaurer_population(self, tours, distances):
+        self.tours = np.ascontiguousarray(tours, dtype=np.int32)
+        self.longueurs = np.asarray(distances, dtype=np.float64)
+        self.nb_routes_distinctes = len(np.unique(self.empreintes(self.tours)))
+
+    # ----- Représentation -----
+
+    def _route_ligne(self, indice):
+        """Route (ordre fermé int32) de la ligne indice, avec sa longueur."""
+        ordre = np.zeros(self.nb_lieux + 1, dtype=np.int32)
+        ordre[:-1] = self.tours[indice]
+        route = Route(self.graph, ordre)
+        route._distance_cache = float(self.longueurs[indice])
+        return route
+
+    def evaluer(self, tours):
+        """Longueurs (P,) des cycles (P, n) en une opération vectorisée."""
+        return self.graph.distances_paires(tours, np.roll(tours, -1, axis=1)).sum(axis=1, dtype=np.float64)
+
+    def empreintes(self, tours):
+        """Empreintes canoniques (P,) uint64 des cycles (voir IndexPopulation.empreinte)."""
+        cles = self.index_population.cles[tours]
+        return (cles * np.roll(cles, -1, axis=1)).sum(axis=1, dtype=np.uint64)
+
+    def _installer(self, tours, longueurs):
+        """Trie la population par longueur et met à jour la meilleure route."""
+        ordre = np.argsort(longueurs, kind="stable")
+        self.tours = tours[ordre]
+        self.longueurs = longueurs[ordre]
+        if self.longueurs[0] < self.meilleure_distance:
+            self.meilleure_route = self._route_ligne(0)
+            self.meilleure_distance = float(self.longueurs[0])
+            self.iteration_meilleure = self.iteration_courante
+            return True
+        return False
+
+    def initialiser_avec_heuristique(self):
+        """Route heuristique (plus proche voisin + 2-opt) et P - 1 cycles aléatoires."""
+        print(f"\n=== Initialisation vectorisée pour {self.nb_lieux} lieux ===")
+        temps_debut = time.time()
+        route_heuristique = self._construire_route_heuristique()
+        
+        nb_routes, n = self.taille_population, self.nb_lieux
+        tours = np.zeros((nb_routes, n), dtype=np.int32)
+        tours[0] = np.asarray(route_heuristique.ordre[:-1], dtype=np.int32)
+        if n > 1:
+            tours[1:, 1:] = np.argsort(np.random.random((nb_routes - 1, n - 1)), axis=1) + 1
+        self.nb_routes_distinctes = len(np.unique(self.empreintes(tours)))
+        self._installer(tours, self.evaluer(tours))
+        
+        temps_total = time.time() - temps_debut
+        print(f"Population créée ({nb_routes} routes): meilleure = {self.meilleure_distance:.2f} "
+              f"en {temps_total:.2f}s")
+        print("=" * 50)
+
+    # ----- Opérateurs sur lots -----
+
+    def selection_tournoi_lot(self, nb, taille_tournoi=None):
+        """Indices de nb vainqueurs de tournois tirés simultanément."""
+        taille_tournoi = min(taille_tournoi or self.taille_tournoi, len(self.tours))
+        candidats = np.random.randint(0, len(self.tours), size=(nb, taille_tournoi))
+        return candidats[np.arange(nb), np.argmin(self.longueurs[candidats], axis=1)]
+
+    def crossover_ox_lot(self, parents1, parents2):
+        """
+        Crossover OX ligne à ligne sur deux matrices de parents (B, n), sans boucle Python.
+        Même règle que TSP_GA.crossover_ox : segment [point1, point2) du parent 1,
+        puis villes restantes du parent 2 lues et placées à partir de point2.
+        """
+        nb, n = parents1.shape
+        m = n - 1  # Le lieu 0 reste en première colonne
+        if m < 2:
+            return parents1.copy()
+        interieur1 = parents1[:, 1:]
+        interieur2 = parents2[:, 1:]
+        point1 = np.random.randint(0, m, size=nb)
+        point2 = np.random.randint(point1 + 1, m + 1)
+        
+        colonnes = np.arange(m)
+        segment = (colonnes >= point1[:, None]) & (colonnes < point2[:, None])
+        utilisees = np.zeros((nb, n), dtype=bool)
+        np.put_along_axis(utilisees, interieur1, segment, axis=1)
+        
+        rotation = (point2[:, None] + colonnes) % m
+        tourne2 = np.take_along_axis(interieur2, rotation, axis=1)
+        gardees = ~np.take_along_axis(utilisees, tourne2, axis=1)
+        libres = ~np.take_along_axis(segment, rotation, axis=1)
+        
+        # Par ligne, autant de positions libres que de villes gardées, dans le même ordre
+        enfants = parents1.copy()
+        lignes = np.broadcast_to(np.arange(nb)[:, None], (nb, m))
+        enfants[:, 1:][lignes[libres], rotation[libres]] = tourne2[gardees]
+        return enfants
+
+    def _bornes_aleatoires(self, nb):
+        """Positions i < j (hors lieu 0) tirées pour nb lignes."""
+        n = self.nb_lieux
+        i = np.random.randint(1, n - 1, size=nb)
+        j = np.random.randint(i + 1, n)
+        return i[:, None], j[:, None]
+
+    def mutation_inversion_lot(self, tours):
+        """Inverse un segment aléatoire de chaque ligne."""
+        i, j = self._bornes_aleatoires(len(tours))
+        colonnes = np.arange(self.nb_lieux)
+        indices = np.where((colonnes >= i) & (colonnes <= j), i + j - colonnes, colonnes)
+        return np.take_along_axis(tours, indices, axis=1)
+
+    def mutation_swap_lot(self, tours):
+        """Échange deux lieux de chaque ligne."""
+        i, j = self._bornes_aleatoires(len(tours))
+        colonnes = np.arange(self.nb_lieux)
+        indices = np.where(colonnes == i, j, np.where(colonnes == j, i, colonnes))
+        return np.take_along_axis(tours, indices, axis=1)
+
+    def mutation_insertion_lot(self, tours):
+        """Déplace un lieu de chaque ligne (de i vers j, ou de j vers i)."""
+        i, j = self._bornes_aleatoires(len(tours))
+        colonnes = np.arange(self.nb_lieux)
+        en_avant = np.random.random((len(tours), 1)) < 0.5
+        avant = np.where((colonnes >= i) & (colonnes < j), colonnes + 1, np.where(colonnes == j, i, colonnes))
+        arriere = np.where((colonnes > i) & (colonnes <= j), colonnes - 1, np.where(colonnes == i, j, colonnes))
+        return np.take_along_axis(tours, np.where(en_avant, avant, arriere), axis=1)
+
+    def muter_lot(self, tours):
+        operateurs = {
+            "inversion": self.mutation_inversion_lot,
+            "swap": self.mutation_swap_lot,
+            "insertion": self.mutation_insertion_lot,
+        }
+        return operateurs[self.type_mutation](tours)
+
+    # ----- Génération -----
+
+    def nouvelle_generation(self):
+        """Élitisme, puis P - nb_elite enfants produits et évalués d'un bloc."""
+        profileur = self.profileur
+        nb_enfants = self.taille_population - self.nb_elite
+        
+        debut = profileur.debut()
+        indices1 = self.selection_tournoi_lot(nb_enfants)
+        indices2 = self.selection_tournoi_lot(nb_enfants)
+        profileur.fin("selection", debut)
+        
+        debut = profileur.debut()
+        enfants = self.tours[indices1]
+        croises = np.random.random(nb_enfants) < self.taux_crossover
+        if croises.any():
+            enfants[croises] = self.crossover_ox_lot(enfants[croises], self.tours[indices2[croises]])
+        profileur.fin("crossover_ox", debut)
+        
+        debut = profileur.debut()
+        if self.nb_lieux > 3:
+            mutes = np.random.random(nb_enfants) < self.taux_mutation
+            if mutes.any():
+                enfants[mutes] = self.muter_lot(enfants[mutes])
+        profileur.fin(f"mutation_{self.type_mutation}", debut)
+        profileur.compter("enfants", nb_enfants)
+        
+        # Doublons (même empreinte qu'une route précédente) : remplacés par une variante mutée
+        debut = profileur.debut()
+        tours = np.concatenate((self.tours[:self.nb_elite], enfants))
+        _, premiers = np.unique(self.empreintes(tours), return_index=True)
+        self.nb_routes_distinctes = len(premiers)
+        doublons = np.ones(len(tours), dtype=bool)
+        doublons[premiers] = False
+        if doublons.any() and self.nb_lieux > 3:
+            tours[doublons] = self.mutation_inversion_lot(tours[doublons])
+            profileur.compter("doublons_rejetes", int(doublons.sum()))
+        profileur.fin("doublons", debut)
+        
+        debut = profileur.debut()
+        longueurs = self.evaluer(tours)
+        profileur.fin("evaluation", debut)
+        
+        # Recherche locale bornée sur le meilleur enfant seulement
+        if self.activer_2opt and self.nb_lieux <= LIMITE_2OPT_ENFANT:
+            meilleur = int(np.argmin(longueurs))
+            route = Route(self.graph, np.append(tours[meilleur], np.int32(0)))
+            route._distance_cache = float(longueurs[meilleur])
+            self.optimisation_2opt_ultra_light(route, pour_enfant=True)
+            tours[meilleur] = route.ordre[:-1]
+            longueurs[meilleur] = route._distance_cache
+        
+        debut = profileur.debut()
+        amelioration = self._installer(tours, longueurs)
+        profileur.fin("tri", debut)
+        return amelioration
+
+    # ----- Migration et statistiques -----
+
+    def meilleurs_individus(self, nb):
+        return [(self._route_ligne(i).ordre, float(self.longueurs[i])) for i in range(min(nb, len(self.tours)))]
+
+    def integrer_migrants(self, migrants):
+        """Remplace les pires lignes par les migrants meilleurs et absents de la population."""
+        tours = self.tours.copy()
+        longueurs = self.longueurs.copy()
+        presentes = set(self.empreintes(tours).tolist())
+        pire = len(tours) - 1
+        for ordre, distance in migrants:
+            cycle = np.asarray(ordre, dtype=np.int32)[:-1]
+            empreinte = int(self.empreintes(cycle[None, :])[0])
+            if pire >= 0 and distance < longueurs[pire] and empreinte not in presentes:
+                tours[pire] = cycle
+                longueurs[pire] = distance
+                presentes.add(empreinte)
+                pire -= 1
+        return self._installer(tours, longueurs)
+
+    def diversite(self):
+        if not len(self.tours):
+            return {"routes_distinctes": 0.0, "aretes_distinctes": 0.0}
+        tours = self.tours.astype(np.int64)
+        suivants = np.roll(tours, -1, axis=1)
+        aretes = np.unique(np.minimum(tours, suivants) * self.nb_lieux + np.maximum(tours, suivants))
+        return {
+            "routes_distinctes": self.nb_routes_distinctes / len(self.tours),
+            "aretes_distinctes": len(aretes) / self.nb_lieux,
+        }
+
+    def taux_routes_distinctes(self):
+        return self.nb_routes_distinctes / max(1, len(self.tours))
+
+
+# ============================================================================
+# RECHERCHE LOCALE ITÉRÉE (ILS)
+#Alternative à la boucle génétique : une seule route courante, perturbée par un
+#double-pont local (deux segments voisins échangés dans une fenêtre de quelques
+#dizaines de positions), réoptimisée seulement autour des lieux touchés, et
+#conservée si elle raccourcit ; sinon les inversions sont défaites (journal).
+#Une perturbation coûte O(k) au lieu de O(n) : une "génération" en enchaîne des milliers.
+# ============================================================================
+
+class RechercheLocaleIteree(TSP_GA):
+    """
+    Recherche locale itérée à double-pont local, avec l'interface de TSP_GA
+    (executer, observateurs, échéance, stagnation, cible, statistiques).
+    """
+
+    def __init__(self, graph, affichage=None, mode_tableau=False, observateurs=None):
+        """
+        Args:
+            graph (Graph): Le graphe à résoudre
+            affichage (Affichage): Interface graphique (optionnelle)
+            mode_tableau (bool): Routes en tableaux NumPy int32
+            observateurs (list): Observateurs de progression
+        """
+        super().__init__(graph, affichage, mode_tableau=mode_tableau, observateurs=observateurs)
+        self.longueur_courante = float('inf')  # Longueur de la route chargée dans recherche_locale
+        self.nb_perturbations = 0
+        self.nb_perturbations_acceptees = 0
+
+    def _configurer_parametres(self):
+        """Paramètres de TSP_GA ; une génération = perturbations_par_generation double-ponts."""
+        super()._configurer_parametres()
+        self.taille_population = 1
+        self.nb_elite = 1
+        self.nb_iterations_max = 100
+        self.perturbations_par_generation = max(1000, self.nb_lieux)
+        self.fenetre_perturbation = 50  # Positions couvertes par un double-pont local
+
+    def activer_parallele(self, nb_processus=None):
+        """Sans objet : une seule route, perturbations séquentielles."""
+        print("Recherche locale itérée : génération parallèle non utilisée.")
+
+    def _restaurer_population(self, tours, distances):
+        """La route restaurée redevient la route courante de la recherche locale."""
+        super()._restaurer_population(tours, distances)
+        if self.recherche_locale is None:
+            self.recherche_locale = RechercheLocale(self.graph)
+        self.recherche_locale.charger(self.population[0].ordre)
+        self.longueur_courante = self.population[0]._distance_cache
+
+    def initialiser_avec_heuristique(self):
+        """Route heuristique (plus proche voisin + 2-opt) menée à un optimum local complet."""
+        print(f"\n=== Initialisation ILS pour {self.nb_lieux} lieux ===")
+        temps_debut = time.time()
+        route = self._construire_route_heuristique()
+        if self.recherche_locale is None:
+            self.recherche_locale = RechercheLocale(self.graph)
+        
+        # Optimum local sur toute la route (le 2-opt initial peut avoir été borné ou sauté)
+        recherche = self.recherche_locale
+        recherche.charger(route.ordre)
+        recherche.executer(temps_max=self.temps_restant())
+        self._installer_courante()
+        
+        temps_total = time.time() - temps_debut
+        print(f"Route initiale: {self.meilleure_distance:.2f} en {temps_total:.2f}s")
+        print("=" * 50)
+
+    def _installer_courante(self):
+        """Fait de la route chargée dans recherche_locale la meilleure route (O(n))."""
+        route = self._creer_route(self.recherche_locale.ordre_ferme(0))
+        route._distance_cache = route.calcul_distance_route()
+        self.longueur_courante = route._distance_cache
+        self.population = [route]
+        self.index_population.vider()
+        self.index_population.ajouter(route)
+        self.meilleure_route = route
+        self.meilleure_distance = route._distance_cache
+
+    def perturber(self):
+        """
+        Applique un double-pont local à la route chargée : a1 [a2..b1] [b2..c1] c2
+        devient a1 [b2..c1] [a2..b1] c2, par trois échanges d'arêtes.
+
+        Returns:
+            tuple: (lieux touchés, allongement dû à la perturbation)
+        """
+        recherche = self.recherche_locale
+        tour = recherche.tour
+        n = len(tour)
+        fenetre = min(self.fenetre_perturbation, n - 2)
+        p = random.randrange(n)
+        o1, o2 = sorted(random.sample(range(1, fenetre + 1), 2))
+        a1, a2 = tour[p], tour[(p + 1) % n]
+        b1, b2 = tour[(p + o1) % n], tour[(p + o1 + 1) % n]
+        c1, c2 = tour[(p + o2) % n], tour[(p + o2 + 1) % n]
+        
+        distance = recherche.distance
+        allongement = (distance(a1, b2) + distance(c1, a2) + distance(b1, c2)
+                       - distance(a1, a2) - distance(b1, b2) - distance(c1, c2))
+        recherche._echanger_aretes(a1, a2, c1, c2)  # a1 [c1..b2] [b1..a2] c2
+        recherche._echanger_aretes(a1, c1, b2, b1)  # a1 [b2..c1] [b1..a2] c2
+        recherche._echanger_aretes(c1, b1, a2, c2)  # a1 [b2..c1] [a2..b1] c2
+        return (a1, a2, b1, b2, c1, c2), allongement
+
+    def nouvelle_generation(self):
+        """
+        Enchaîne perturbations_par_generation itérations perturbation / recherche locale
+        autour des lieux touchés / acceptation si la route raccourcit.
+
+        Returns:
+            bool: True si la meilleure route a été améliorée
+        """
+        recherche = self.recherche_locale
+        if recherche is None or len(recherche.tour) < 8:
+            return False
+        profileur = self.profileur
+        debut = profileur.debut()
+        acceptees = 0
+        
+        for compteur in range(self.perturbations_par_generation):
+            if self.echeance is not None and compteur % 256 == 0 and time.time() > self.echeance:
+                break
+            journal = recherche.journal = []
+            touches, allongement = self.perturber()
+            gain = recherche.executer(villes_actives=touches)
+            recherche.journal = None
+            if gain - allongement > 1e-9:
+                self.longueur_courante -= gain - allongement
+                acceptees += 1
+            else:
+                recherche.annuler(journal)
+            self.nb_perturbations += 1
+        
+        self.nb_perturbations_acceptees += acceptees
+        profileur.fin("perturbations", debut)
+        profileur.compter("perturbations_acceptees", acceptees)
+        
+        if self.longueur_courante < self.meilleure_distance - 1e-9:
+            self._installer_courante()  # Longueur recalculée : pas de dérive des gains cumulés
+            self.iteration_meilleure = self.iteration_courante
+            return True
+        return False
+
+    def statistiques(self, temps_total=None):
+        """Statistiques de TSP_GA et compteurs de perturbations."""
+        statistiques = super().statistiques(temps_total)
+        statistiques["perturbations"] = self.nb_perturbations
+        statistiques["perturbations_acceptees"] = self.nb_perturbations_acceptees
+        return statistiques
+
+
+# ============================================================================
+# GÉNÉRATION PARALLÈLE (POOL DE PROCESSUS + MÉMOIRE PARTAGÉE)
+# ============================================================================
+
+class MemoirePartagee:
+    """
+    Copie les tableaux du graphe (coordonnées, matrice, voisins candidats)
+    dans des blocs de mémoire partagée, attachables par les processus du pool.
+    """
+
+    def __init__(self, graph):
+        self.blocs = []
+        self.descripteur = {}
+        tableaux = {
+            "coordonnees": graph.coordonnees,
+            "matrice_od": graph.matrice_od,
+            "voisins_candidats": graph.voisins_candidats,
+        }
+        for nom, tableau in tableaux.items():
+            if tableau is None:
+                continue
+            if isinstance(tableau, np.memmap) and tableau.filename:
+                # Déjà sur disque : les processus ouvrent le même fichier (cache de pages partagé)
+                self.descripteur[nom] = ("fichier", tableau.filename)
+                continue
+            bloc = shared_memory.SharedMemory(create=True, size=max(1, tableau.nbytes))
+            copie = np.ndarray(tableau.shape, dtype=tableau.dtype, buffer=bloc.buf)
+            copie[...] = tableau
+            self.blocs.append(bloc)
+            self.descripteur[nom] = (bloc.name, tableau.shape, tableau.dtype.str)
+
+    def fermer(self):
+        """Libère les blocs de mémoire partagée."""
+        for bloc in self.blocs:
+            bloc.close()
+            bloc.unlink()
+        self.blocs = []
+
+
+def attacher_memoire_partagee(descripteur):
+    """
+    Reconstruit des tableaux NumPy sur les blocs décrits par MemoirePartagee.
+    
+    Returns:
+        tuple: (dict nom -> np.ndarray, liste des blocs à garder ouverts)
+    """
+    tableaux = {}
+    blocs = []
+    for nom, description in descripteur.items():
+        if description[0] == "fichier":
+            tableaux[nom] = np.load(description[1], mmap_mode='r')
+            continue
+        nom_bloc, forme, dtype = description
+        bloc = shared_memory.SharedMemory(name=nom_bloc)
+        blocs.append(bloc)
+        tableaux[nom] = np.ndarray(forme, dtype=np.dtype(dtype), buffer=bloc.buf)
+    return tableaux, blocs
+
+
+_CONTEXTE_WORKER = {}  # État propre à chaque processus du pool
+
+
+def _initialiser_worker(descripteur, parametres):
+    """Initialise un processus du pool : graphe sur mémoire partagée et opérateurs GA."""
+    tableaux, blocs = attacher_memoire_partagee(descripteur)
+    graph = Graph.depuis_tableaux(tableaux["coordonnees"],
+                                  matrice_od=tableaux.get("matrice_od"),
+                                  voisins_candidats=tableaux.get("voisins_candidats"))
+    tsp_ga = TSP_GA(graph, None, mode_tableau=True)
+    for nom, valeur in parametres.items():
+        setattr(tsp_ga, nom, valeur)
+    _CONTEXTE_WORKER["blocs"] = blocs
+    _CONTEXTE_WORKER["tsp_ga"] = tsp_ga
+
+
+def _produire_lot_enfants(tache):
+    """
+    Produit les enfants d'un lot de paires de parents dans un processus du pool.
+    Renvoie les (ordre, longueur) des enfants et le temps CPU consommé.
+    """
+    debut = time.process_time()
+    lot, graine = tache
+    tsp_ga = _CONTEXTE_WORKER["tsp_ga"]
+    random.seed(graine)
+    np.random.seed(graine)
+    resultats = []
+    for ordre1, distance1, ordre2, distance2 in lot:
+        parent1 = Route(tsp_ga.graph, ordre1)
+        parent1._distance_cache = distance1
+        parent2 = Route(tsp_ga.graph, ordre2)
+        parent2._distance_cache = distance2
+        enfant = tsp_ga._produire_enfant(parent1, parent2)
+        resultats.append((enfant.vers_tableau(), enfant._distance_cache))
+    return resultats, time.process_time() - debut
+
+
+# ============================================================================
+# MODÈLE EN ÎLES
+#Plusieurs populations TSP_GA indépendantes tournent chacune dans un processus
+#et s'échangent périodiquement leurs meilleures routes (anneau ou graphe complet).
+#Le graphe est partagé entre les îles via la mémoire partagée.
+# ============================================================================
+
+class ModeleIles:
+    """
+    Algorithme génétique en îles avec migration entre processus.
+    """
+
+    def __init__(self, graph, nb_iles=None, topologie="anneau", intervalle_migration=5,
+                 nb_migrants=2, taille_population=None, nb_generations=None, graine=None):
+        """
+        Args:
+            graph (Graph): Le graphe à résoudre
+            nb_iles (int): Nombre d'îles / processus (par défaut : nombre de cœurs)
+            topologie (str): "anneau" (vers l'île suivante) ou "complet" (vers toutes)
+            intervalle_migration (int): Nombre de générations entre deux migrations
+            nb_migrants (int): Nombre de meilleures routes envoyées à chaque migration
+            taille_population (int): Taille de population par île (défaut : celle de TSP_GA)
+            nb_generations (int): Générations par île (défaut : nb_iterations_max de TSP_GA)
+            graine (int): Graine aléatoire (chaque île utilise graine + indice)
+        """
+        if topologie not in ("anneau", "complet"):
+            raise ValueError(f"Topologie inconnue: {topologie}")
+        if nb_iles is not None and nb_iles < 1:
+            raise ValueError(f"Nombre d'îles invalide: {nb_iles} (au moins 1)")
+        if intervalle_migration < 1:
+            raise ValueError(f"Intervalle de migration invalide: {intervalle_migration} (au moins 1)")
+        self.graph = graph
+        self.nb_iles = nb_iles or os.cpu_count() or 1
+        self.topologie = topologie
+        self.intervalle_migration = intervalle_migration
+        self.nb_migrants = nb_migrants
+        self.taille_population = taille_population
+        self.nb_generations = nb_generations
+        self.graine = graine if graine is not None else random.getrandbits(32)
+        self.meilleure_route = None
+        self.meilleure_distance = float('inf')
+        self.resultats_iles = []
+
+    def destinations(self, indice):
+        """Îles vers lesquelles l'île indice envoie ses migrants."""
+        if self.nb_iles < 2:
+            return []
+        if self.topologie == "anneau":
+            return [(indice + 1) % self.nb_iles]
+        return [j for j in range(self.nb_iles) if j != indice]
+
+    def executer(self):
+        """
+        Lance toutes les îles et attend leur fin.
+        
+        Returns:
+            Route: La meilleure route trouvée sur l'ensemble des îles
+        """
+        if self.graph.voisins_candidats is None:
+            self.graph.calcul_voisins_candidats()
+        memoire = MemoirePartagee(self.graph)
+        contexte = multiprocessing.get_context("spawn")
+        files = [contexte.Queue() for _ in range(self.nb_iles)]
+        file_resultats = contexte.Queue()
+        parametres = {
+            "taille_population": self.taille_population,
+            "nb_generations": self.nb_generations,
+            "intervalle_migration": self.intervalle_migration,
+            "nb_migrants": self.nb_migrants,
+        }
+        processus = []
+        try:
+            for indice in range(self.nb_iles):
+                sorties = [files[j] for j in self.destinations(indice)]
+                p = contexte.Process(target=_executer_ile,
+                                     args=(indice, self.graine + indice, memoire.descripteur,
+                                           parametres, files[indice], sorties, file_resultats))
+                p.start()
+                processus.append(p)
+            
+            self.resultats_iles = self._attendre_resultats(processus, file_resultats)
+            for p in processus:
+                p.join()
+        finally:
+            for p in processus:
+                if p.is_alive():
+                    p.terminate()
+                    p.join()
+            memoire.fermer()
+        
+        self.resultats_iles.sort(key=lambda resultat: resultat["distance"])
+        meilleur = self.resultats_iles[0]
+        self.meilleure_route = Route(self.graph, meilleur["ordre"].tolist())
+        self.meilleure_route._distance_cache = meilleur["distance"]
+        self.meilleure_distance = meilleur["distance"]
+        return self.meilleure_route
+
+
+    def _attendre_resultats(self, processus, file_resultats, delai=1.0):
+        """
+        Recueille le résultat de chaque île sans jamais attendre indéfiniment : une île
+        en erreur renvoie sa trace, une île morte sans résultat est détectée par son code de sortie.
+
+        Raises:
+            RuntimeError: Une île a échoué (exception ou arrêt anormal du processus)
+        """
+        resultats = []
+        while len(resultats) < len(processus):
+            try:
+                resultat = file_resultats.get(timeout=delai)
+            except queue.Empty:
+                recus = {r["ile"] for r in resultats}
+                mortes = [i for i, p in enumerate(processus) if i not in recus and p.exitcode is not None]
+                if not mortes:
+                    continue
+                try:  # Le résultat d'une île qui vient de finir peut être encore en transit
+                    resultat = file_resultats.get(timeout=delai)
+                except queue.Empty:
+                    raise RuntimeError(f"Île {mortes[0]} arrêtée sans résultat "
+                                       f"(code de sortie {processus[mortes[0]].exitcode})") from None
+            if "erreur" in resultat:
+                raise RuntimeError(f"Île {resultat['ile']} en erreur:\n{resultat['erreur']}")
+            resultats.append(resultat)
+        return resultats
+
+
+def _executer_ile(indice, graine, descripteur, parametres, file_entree, sorties, file_resultats):
+    """Exécute une île ; une exception est renvoyée au processus principal avec sa trace."""
+    try:
+        _boucle_ile(indice, graine, descripteur, parametres, file_entree, sorties, file_resultats)
+    except Exception:
+        file_resultats.put({"ile": indice, "erreur": traceback.format_exc()})
+
+
+def _boucle_ile(indice, graine, descripteur, parametres, file_entree, sorties, file_resultats):
+    """Boucle GA d'une île : générations, envoi et réception des migrants."""
+    random.seed(graine)
+    np.random.seed(graine % (2 ** 32))
+    tableaux, blocs = attacher_memoire_partagee(descripteur)
+    graph = Graph.depuis_tableaux(tableaux["coordonnees"],
+                                  matrice_od=tableaux.get("matrice_od"),
+                                  voisins_candidats=tableaux.get("voisins_candidats"))
+    tsp_ga = TSP_GA(graph, None, mode_tableau=True)
+    if parametres["taille_population"]:
+        tsp_ga.taille_population = parametres["taille_population"]
+    nb_generations = parametres["nb_generations"] or tsp_ga.nb_iterations_max
+    tsp_ga.initialiser_avec_heuristique()
+    
+    # Les migrants non lus à la fin d'une île peuvent être perdus sans bloquer sa sortie
+    for sortie in sorties:
+        sortie.cancel_join_thread()
+    
+    nb_migrations_recues = 0
+    for iteration in range(1, nb_generations + 1):
+        tsp_ga.iteration_courante = iteration
+        tsp_ga.nouvelle_generation()
+        
+        if iteration % parametres["intervalle_migration"] == 0:
+            migrants = tsp_ga.meilleurs_individus(parametres["nb_migrants"])
+            for sortie in sorties:
+                sortie.put(migrants)
+            # Réception non bloquante des migrants déjà arrivés
+            while True:
+                try:
+                    recus = file_entree.get_nowait()
+                except queue.Empty:
+                    break
+                tsp_ga.integrer_migrants(recus)
+                nb_migrations_recues += 1
+    
+    file_resultats.put({
+        "ile": indice,
+        "ordre": np.asarray(tsp_ga.meilleure_route.ordre, dtype=np.int32),
+        "distance": tsp_ga.meilleure_distance,
+        "iteration_meilleure": tsp_ga.iteration_meilleure,
+        "migrations_recues": nb_migrations_recues,
+    })
+    for bloc in blocs:
+        bloc.close()
+
+
+# ============================================================================
+# DÉCOMPOSITION SPATIALE (TRÈS GRANDES INSTANCES)
+#Les lieux sont découpés en clusters compacts de taille bornée (bandes verticales
+#de même effectif, elles-mêmes découpées en cellules), parcourus en serpentin.
+#Chaque cluster est résolu indépendamment (TSP_GA + recherche locale) dans un
+#processus, les sous-routes sont raccordées en une route globale, puis les lieux
+#proches d'une frontière de cluster sont réoptimisés par la recherche locale.
+#Le coût total est linéaire en n (clusters de taille fixe).
+# ============================================================================
+
+class SolveurDecomposition:
+    """
+    Résolution par décomposition spatiale : partition, résolution des clusters
+    en parallèle, raccordement, réparation des frontières puis passe globale.
+    """
+
+    def __init__(self, graph, lieux_par_cluster=LIEUX_PAR_CLUSTER, nb_processus=None,
+                 nb_generations=5, temps_max=None, graine=None):
+        """
+        Args:
+            graph (Graph): Le graphe à résoudre (coordonnées uniquement, sans matrice)
+            lieux_par_cluster (int): Taille visée des clusters
+            nb_processus (int): Processus pour les clusters (défaut : nombre de cœurs, 1 = série)
+            nb_generations (int): Générations du GA par cluster (0 = heuristique et 2-opt seuls)
+            temps_max (float): Budget de temps total en secondes (None = illimité)
+            graine (int): Graine aléatoire (chaque cluster utilise graine + indice)
+        """
+        self.graph = graph
+        self.lieux_par_cluster = max(4, lieux_par_cluster)
+        self.nb_processus = nb_processus or os.cpu_count() or 1
+        self.nb_generations = nb_generations
+        self.temps_max = temps_max
+        self.graine = graine if graine is not None else random.getrandbits(32)
+        self.part_temps_clusters = 0.7  # Le reste du budget va à la réparation des frontières
+        self.clusters = []
+        self.meilleure_route = None
+        self.meilleure_distance = float('inf')
+        self.distance_avant_reparation = None
+
+    def partitionner(self):
+        """
+        Découpe les lieux en clusters de même effectif : bandes verticales (quantiles
+        en x), puis cellules dans chaque bande (quantiles en y). Les cellules sont
+        rangées en serpentin, de sorte que deux clusters successifs sont voisins.
+
+        Returns:
+            list: Tableaux d'indices globaux, un par cluster, dans l'ordre de visite
+        """
+        coordonnees = self.graph.coordonnees
+        n = len(coordonnees)
+        nb_clusters = max(1, -(-n // self.lieux_par_cluster))
+        nb_bandes = max(1, round(math.sqrt(nb_clusters)))
+        
+        clusters = []
+        par_x = np.argsort(coordonnees[:, 0], kind='stable')
+        for b, bande in enumerate(np.array_split(par_x, nb_bandes)):
+            par_y = bande[np.argsort(coordonnees[bande, 1], kind='stable')]
+            if b % 2 == 1:
+                par_y = par_y[::-1]  # Serpentin : une bande sur deux parcourue vers le bas
+            nb_cellules = max(1, round(len(bande) / self.lieux_par_cluster))
+            clusters.extend(cellule for cellule in np.array_split(par_y, nb_cellules) if len(cellule))
+        self.clusters = clusters
+        return clusters
+
+    def resoudre_clusters(self, temps_max=None):
+        """
+        Résout chaque cluster indépendamment, en parallèle si nb_processus > 1.
+
+        Args:
+            temps_max (float): Budget de temps de l'ensemble des clusters (None = illimité)
+
+        Returns:
+            list: Ordres fermés locaux (int32, indices dans le cluster), un par cluster
+        """
+        coordonnees = self.graph.coordonnees
+        nb_processus = min(self.nb_processus, len(self.clusters))
+        budget = None
+        if temps_max is not None:
+            # Budget d'un cluster : sa part du temps d'un processus
+            budget = temps_max * nb_processus / len(self.clusters)
+        taches = [(np.ascontiguousarray(coordonnees[indices]), self.nb_generations, budget,
+                   (self.graine + c) % (2 ** 32))
+                  for c, indices in enumerate(self.clusters)]
+        
+        if nb_processus <= 1:
+            return [_resoudre_cluster(tache) for tache in taches]
+        contexte = multiprocessing.get_context("spawn")
+        with contexte.Pool(nb_processus) as pool:
+            return pool.map(_resoudre_cluster, taches, chunksize=max(1, len(taches) // (4 * nb_processus)))
+
+    def raccorder(self, ordres_locaux):
+        """
+        Raccorde les sous-routes en une route globale : chaque cycle est ouvert au lieu
+        le plus proche de la sortie du cluster précédent, et parcouru dans le sens dont
+        la sortie est la plus proche du cluster suivant.
+
+        Returns:
+            np.ndarray: Ordre fermé global [0, ..., 0] en int32
+        """
+        coordonnees = self.graph.coordonnees
+        centres = [coordonnees[indices].mean(axis=0) for indices in self.clusters]
+        morceaux = []
+        sortie = None
+        for c, (indices, ordre) in enumerate(zip(self.clusters, ordres_locaux)):
+            cycle = indices[ordre[:-1]]
+            if sortie is not None and len(cycle) > 1:
+                ecarts = coordonnees[cycle] - coordonnees[sortie]
+                entree = int(np.argmin((ecarts * ecarts).sum(axis=1)))
+                cycle = np.roll(cycle, -entree)
+            if c + 1 < len(self.clusters) and len(cycle) > 2:
+                # Sens direct (sortie cycle[-1]) ou inverse (sortie cycle[1])
+                centre = centres[c + 1]
+                direct = coordonnees[cycle[-1]] - centre
+                inverse = coordonnees[cycle[1]] - centre
+                if (inverse * inverse).sum() < (direct * direct).sum():
+                    cycle = np.concatenate((cycle[:1], cycle[:0:-1]))
+            morceaux.append(cycle)
+            sortie = cycle[-1]
+        
+        tour = np.concatenate(morceaux)
+        depart = int(np.flatnonzero(tour == 0)[0])
+        tour = np.roll(tour, -depart)
+        return np.append(tour, 0).astype(np.int32)
+
+    def lieux_frontiere(self):
+        """Lieux dont au moins un voisin candidat appartient à un autre cluster."""
+        etiquettes = np.empty(len(self.graph.coordonnees), dtype=np.int32)
+        for c, indices in enumerate(self.clusters):
+            etiquettes[indices] = c
+        voisins = self.graph.calcul_voisins_candidats()
+        frontiere = (etiquettes[voisins] != etiquettes[:, None]).any(axis=1)
+        return np.flatnonzero(frontiere)
+
+    def executer(self):
+        """
+        Enchaîne partition, résolution des clusters, raccordement et réparation.
+
+        Returns:
+            dict: Meilleure route (ordre), distance et statistiques
+        """
+        temps_debut = time.time()
+        echeance = None if self.temps_max is None else temps_debut + self.temps_max
+        if self.graph.coordonnees is None:
+            self.graph.construire_coordonnees()
+        n = len(self.graph.coordonnees)
+        
+        self.partitionner()
+        print(f"Décomposition: {len(self.clusters)} clusters d'environ {n // len(self.clusters)} lieux")
+        temps_clusters = time.time()
+        budget = None if echeance is None else (echeance - temps_clusters) * self.part_temps_clusters
+        ordres_locaux = self.resoudre_clusters(budget)
+        temps_clusters = time.time() - temps_clusters
+        
+        ordre = self.raccorder(ordres_locaux)
+        route = Route(self.graph, ordre)
+        self.distance_avant_reparation = self.graph.longueur_tour(ordre)
+        print(f"Clusters résolus en {temps_clusters:.1f}s, route raccordée: {self.distance_avant_reparation:.2f}")
+        
+        temps_reparation = time.time()
+        frontiere = self.lieux_frontiere()
+        recherche = RechercheLocale(self.graph)
+        budget = None if echeance is None else max(0.0, echeance - temps_reparation)
+        recherche.optimiser(route, temps_max=budget, villes_actives=frontiere.tolist())
+        # Passe globale (2-opt et Or-opt sur tous les lieux) jusqu'à l'optimum local
+        budget = None if echeance is None else max(0.0, echeance - time.time())
+        recherche.optimiser(route, temps_max=budget)
+        temps_reparation = time.time() - temps_reparation
+        
+        self.meilleure_route = route
+        self.meilleure_distance = self.graph.longueur_tour(route.ordre)
+        route._distance_cache = self.meilleure_distance
+        print(f"Réparation de {len(frontiere)} lieux frontière en {temps_reparation:.1f}s: "
+              f"{self.meilleure_distance:.2f}")
+        
+        # Jusqu'à LIMITE_2OPT_HEURISTIQUE, le chemin simple (plus proche voisin + recherche
+        # locale) reste abordable : la décomposition n'en rend jamais une route plus longue
+        distance_simple = None
+        if n <= LIMITE_2OPT_HEURISTIQUE:
+            simple = Route(self.graph, np.array(self.graph.tour_plus_proche_voisin(0), dtype=np.int32))
+            budget = None if echeance is None else max(0.0, echeance - time.time())
+            recherche.optimiser(simple, temps_max=budget)
+            distance_simple = self.graph.longueur_tour(simple.ordre)
+            if distance_simple < self.meilleure_distance:
+                print(f"Route simple plus courte: {distance_simple:.2f}")
+                simple._distance_cache = distance_simple
+                self.meilleure_route = route = simple
+                self.meilleure_distance = distance_simple
+        
+        return {
+            "ordre": [int(v) for v in route.ordre],
+            "distance": self.meilleure_distance,
+            "distance_avant_reparation": self.distance_avant_reparation,
+            "distance_simple": distance_simple,
+            "nb_lieux": n,
+            "nb_clusters": len(self.clusters),
+            "lieux_frontiere": len(frontiere),
+            "temps_clusters": temps_clusters,
+            "temps_reparation": temps_reparation,
+            "temps": time.time() - temps_debut,
+            "raison_arret": "decomposition",
+        }
+
+
+def _resoudre_cluster(tache):
+    """Résout un cluster (processus du pool) ; renvoie son ordre fermé local en int32."""
+    coordonnees, nb_generations, temps_max, graine = tache
+    random.seed(graine)
+    np.random.seed(graine)
+    with contextlib.redirect_stdout(io.StringIO()):
+        graph = Graph.depuis_tableaux(coordonnees)
+        if len(coordonnees) < SEUIL_MATRICE:
+            graph.calcul_matrice_cout_od()
+        tsp_ga = TSP_GA(graph, mode_tableau=True)
+        tsp_ga.definir_budget(temps_max)
+        if tsp_ga.resolution_exacte():
+            tsp_ga.executer()
+        else:
+            tsp_ga.initialiser_avec_heuristique()
+            if nb_generations > 0:
+                tsp_ga.executer(nb_iterations=nb_generations)
+    return np.asarray(tsp_ga.meilleure_route.ordre, dtype=np.int32)
+
+
+# ============================================================================
+# MODE SANS AFFICHAGE (API ET LIGNE DE COMMANDE)
+# ============================================================================
+
+def resoudre(chemin=None, nb_lieux=NB_LIEUX, graine=None, temps_max=None,
+             nb_iterations=None, observateurs=None, nb_processus=0, mode_tableau=True,
+             dossier_cache=None, type_crossover="ox",
+             max_stagnation=None, distance_cible=None, profil=False, moteur="liste",
+             taille_population=None, seuil_exact=SEUIL_HELD_KARP, lieux_par_cluster=LIEUX_PAR_CLUSTER,
+             point_reprise=None, intervalle_reprise=30.0, reprendre=False):
+    """
+    Résout une instance sans interface graphique.
+
+    Args:
+        chemin (str): Fichier CSV des lieux (None = génération aléatoire)
+        nb_lieux (int): Nombre de lieux générés si chemin est None
+        graine (int): Graine des générateurs aléatoires (reproductibilité)
+        temps_max (float): Budget de temps de la résolution (2-opt initial et générations), en secondes
+        nb_iterations (int): Nombre de générations (défaut : selon la taille)
+        observateurs (list): Observateurs de progression (ObservateurProgression)
+        nb_processus (int): Processus pour la génération parallèle (0/1 = série)
+        mode_tableau (bool): Routes en tableaux NumPy int32
+        dossier_cache (str): Dossier de persistance de la matrice et des voisins (np.memmap)
+        type_crossover (str): Opérateur de crossover ("ox" ou "erx")
+        max_stagnation (int): Générations sans amélioration avant arrêt
+        distance_cible (float): Longueur suffisante pour s'arrêter
+        profil (bool): Active les minuteries et compteurs par opérateur (Profileur)
+        moteur (str): "liste" (TSP_GA), "vectorise" (TSP_GA_Vectorise, population en matrice),
+            "ils" (RechercheLocaleIteree), "decomposition" (SolveurDecomposition) ou "auto" (décomposition au-delà
+            de LIMITE_2OPT_HEURISTIQUE lieux, liste sinon)
+        taille_population (int): Taille de la population (défaut : selon la taille et le moteur)
+        seuil_exact (int): Nombre de lieux jusqu'auquel Held-Karp remplace le GA (0 = jamais)
+        lieux_par_cluster (int): Taille visée des clusters (moteur "decomposition")
+        point_reprise (str): Fichier où écrire périodiquement l'état de la résolution
+        intervalle_reprise (float): Secondes minimales entre deux points de reprise
+        reprendre (bool): Continuer depuis point_reprise s'il existe (même instance)
+
+    Returns:
+        dict: Meilleure route (ordre), distance et statistiques
+    """
+    if graine is not None:
+        random.seed(graine)
+        np.random.seed(graine % (2 ** 32))
+
+    temps_debut = time.time()
+    graph = Graph(path=chemin, nb_lieux_defaut=nb_lieux, dossier_cache=dossier_cache,
+                  calculer_matrice=temps_max is None and moteur != "decomposition")
+    if not graph.liste_lieux:
+        raise ValueError(f"Aucun lieu chargé depuis {chemin}")
+    if moteur == "auto":
+        moteur = "decomposition" if len(graph.liste_lieux) > LIMITE_2OPT_HEURISTIQUE else "liste"
+    if moteur == "decomposition":
+        restant = None if temps_max is None else max(0.0, temps_debut + temps_max - time.time())
+        solveur = SolveurDecomposition(graph, lieux_par_cluster=lieux_par_cluster,
+                                       nb_processus=nb_processus or None, temps_max=restant,
+                                       graine=graine)
+        resultat = solveur.executer()
+        resultat["graine"] = graine
+        resultat["temps_total"] = time.time() - temps_debut
+        return resultat
+    if temps_max is not None:
+        # Matrice construite seulement si elle tient dans un quart du budget (sinon mode direct)
+        n = len(graph.liste_lieux)
+        if n < SEUIL_MATRICE and n * n * COUT_CASE_MATRICE <= temps_max / 4:
+            if dossier_cache:
+                graph.charger_ou_calculer_matrice(dossier_cache)
+            else:
+                graph.calcul_matrice_cout_od()
+
+    if moteur == "vectorise":
+        tsp_ga = TSP_GA_Vectorise(graph, observateurs=observateurs, taille_population=taille_population)
+    elif moteur == "ils":
+        tsp_ga = RechercheLocaleIteree(graph, mode_tableau=mode_tableau, observateurs=observateurs)
+    else:
+        tsp_ga = TSP_GA(graph, mode_tableau=mode_tableau, observateurs=observateurs)
+        if taille_population:
+            tsp_ga.taille_population = taille_population
+    tsp_ga.type_crossover = type_crossover
+    tsp_ga.seuil_exact = seuil_exact
+    tsp_ga.profileur.actif = profil
+    if temps_max is not None:
+        # L'échéance court depuis le début de la résolution (chargement compris)
+        tsp_ga.echeance = temps_debut + temps_max
+    if point_reprise:
+        tsp_ga.activer_points_reprise(point_reprise, intervalle_reprise)
+    if not tsp_ga.resolution_exacte():
+        if reprendre and point_reprise and os.path.exists(point_reprise):
+            tsp_ga.reprendre(point_reprise)
+        else:
+            tsp_ga.initialiser_avec_heuristique()
+        if nb_processus > 1:
+            tsp_ga.activer_parallele(nb_processus)
+    resultat = tsp_ga.executer(nb_iterations=nb_iterations, max_stagnation=max_stagnation,
+                               distance_cible=distance_cible)
+    resultat["graine"] = graine
+    resultat["temps_total"] = time.time() - temps_debut
+    return resultat
+
+
+def executer_avec_capture(fonction, chemin_cprofile=None, suivre_memoire=False, nb_lignes=10):
+    """
+    Exécute fonction() sous cProfile et/ou tracemalloc.
+
+    Args:
+        fonction (callable): Fonction sans argument à exécuter
+        chemin_cprofile (str): Fichier des statistiques cProfile (lisible par pstats), optionnel
+        suivre_memoire (bool): Suivi des allocations avec tracemalloc
+        nb_lignes (int): Nombre de lignes d'allocation rapportées
+
+    Returns:
+        tuple: (résultat de fonction, rapport mémoire ou None)
+    """
+    import cProfile
+    import tracemalloc
+
+    profil = cProfile.Profile() if chemin_cprofile else None
+    if suivre_memoire:
+        tracemalloc.start()
+    if profil is not None:
+        profil.enable()
+    try:
+        resultat = fonction()
+    finally:
+        if profil is not None:
+            profil.disable()
+            profil.dump_stats(chemin_cprofile)
+    memoire = None
+    if suivre_memoire:
+        instantane = tracemalloc.take_snapshot()
+        actuelle, pic = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        memoire = {
+            "actuelle_ko": actuelle // 1024,
+            "pic_ko": pic // 1024,
+            "allocations": [{"ligne": str(stat.traceback), "taille_ko": stat.size // 1024, "nombre": stat.count}
+                            for stat in instantane.statistics('lineno')[:nb_lignes]],
+        }
+    return resultat, memoire
+
+
+def main_cli(argv=None):
+    """Point d'entrée en ligne de commande : résout une instance et écrit le résultat en JSON."""
+    import json
+
+    parser = argparse.ArgumentParser(description="Résolution du TSP par algorithme génétique (sans affichage)")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--fichier", help="Fichier CSV des lieux")
+    source.add_argument("--nb-lieux", type=int, default=NB_LIEUX, help="Nombre de lieux générés aléatoirement")
+    parser.add_argument("--graine", type=int, default=None, help="Graine aléatoire")
+    parser.add_argument("--temps-max", type=float, default=None, help="Budget de temps total (s)")
+    parser.add_argument("--stagnation", type=int, default=None,
+                        help="Arrêt après ce nombre de générations sans amélioration")
+    parser.add_argument("--cible", type=float, default=None, help="Arrêt dès cette longueur atteinte")
+    parser.add_argument("--iterations", type=int, default=None, help="Nombre de générations")
+    parser.add_argument("--processus", type=int, default=0, help="Processus pour la génération parallèle")
+    parser.add_argument("--dossier-cache", default=None,
+                        help="Dossier où persister matrice et voisins candidats entre exécutions")
+    parser.add_argument("--crossover", choices=("ox", "erx"), default="ox",
+                        help="Opérateur de crossover : ox ou erx (recombinaison d'arêtes)")
+    parser.add_argument("--seuil-exact", type=int, default=SEUIL_HELD_KARP,
+                        help="Nombre de lieux jusqu'auquel la route optimale est calculée (Held-Karp)")
+    parser.add_argument("--moteur", choices=("liste", "vectorise", "ils", "decomposition", "auto"),
+                        default="liste",
+                        help="Moteur : liste de Route, population en matrice NumPy, recherche locale "
+                             "itérée, décomposition spatiale (très grandes instances) ou choix selon la taille")
+    parser.add_argument("--lieux-par-cluster", type=int, default=LIEUX_PAR_CLUSTER,
+                        help="Taille visée des clusters du moteur decomposition")
+    parser.add_argument("--population", type=int, default=None, help="Taille de la population")
+    parser.add_argument("--point-reprise", default=None,
+                        help="Fichier où écrire périodiquement l'état (population, générateurs aléatoires)")
+    parser.add_argument("--intervalle-reprise", type=float, default=30.0,
+                        help="Secondes minimales entre deux points de reprise")
+    parser.add_argument("--reprendre", action="store_true",
+                        help="Continuer depuis --point-reprise s'il existe")
+    parser.add_argument("--profil", action="store_true",
+                        help="Minuteries et compteurs par opérateur, ajoutés au résultat")
+    parser.add_argument("--stats-jsonl", default=None, help="Fichier JSON lines des statistiques par génération")
+    parser.add_argument("--cprofile", default=None, help="Fichier des statistiques cProfile de l'exécution")
+    parser.add_argument("--tracemalloc", action="store_true", help="Pic mémoire et principales allocations")
+    parser.add_argument("--sortie", default=None, help="Fichier JSON de résultat (défaut : sortie standard)")
+    parser.add_argument("--silencieux", action="store_true", help="Ne pas afficher la progression")
+    args = parser.parse_args(argv)
+
+    observateurs = [] if args.silencieux else [ObservateurConsole()]
+    if args.stats_jsonl:
+        observateurs.append(ObservateurStatistiques(args.stats_jsonl))
+    resultat, memoire = executer_avec_capture(
+        lambda: resoudre(chemin=args.fichier, nb_lieux=args.nb_lieux, graine=args.graine,
+                         temps_max=args.temps_max, nb_iterations=args.iterations,
+                         observateurs=observateurs, nb_processus=args.processus,
+                         dossier_cache=args.dossier_cache,
+                         type_crossover=args.crossover, max_stagnation=args.stagnation,
+                         distance_cible=args.cible, profil=args.profil, moteur=args.moteur,
+                         taille_population=args.population, seuil_exact=args.seuil_exact,
+                         lieux_par_cluster=args.lieux_par_cluster, point_reprise=args.point_reprise,
+                         intervalle_reprise=args.intervalle_reprise, reprendre=args.reprendre),
+        chemin_cprofile=args.cprofile, suivre_memoire=args.tracemalloc)
+    if memoire is not None:
+        resultat["memoire"] = memoire
+
+    texte = json.dumps(resultat)
+    if args.sortie:
+        with open(args.sortie, 'w', encoding='utf-8') as fichier:
+            fichier.write(texte)
+    else:
+        print(texte)
+    return resultat
+
+
 # ============================================================================
 # FONCTION PRINCIPALE
 # ============================================================================
 
-def main_interactive(nom_fichier=None):
+def main_interactive(nom_fichier=None, nb_processus=0):
 
     from __main__ import Graph, Affichage, NB_LIEUX
     
@@ -878,6 +3864,8 @@ def main_interactive(nom_fichier=None):
     # Algorithme
     tsp_ga = TSP_GA(graph, affichage)
     tsp_ga.initialiser_avec_heuristique()
+    if nb_processus > 1:
+        tsp_ga.activer_parallele(nb_processus)
     
     # Lancement dans un thread
     affichage.root.after(400, tsp_ga.lancer)
@@ -886,7 +3874,11 @@ def main_interactive(nom_fichier=None):
     affichage.lancer()
 
 
-if __name__ == "__main__":
+if __name__ == "__main__" and len(sys.argv) > 1:
+    # Mode sans affichage : python tsp_graph_init.py --nb-lieux 1000 --graine 1 --temps-max 10
+    main_cli()
+
+elif __name__ == "__main__":
     
     # === OPTION 1 : FICHIER CSV ===================================
     # Décommente pour utiliser un fichier fourni